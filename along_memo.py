@@ -0,0 +1,99 @@
+"""
+Memo of recent distance-along-route results.
+
+Every spectator's browser asks for the distance of the same rider,
+at the same Spot fix, from the same prior fix, so between Spot
+updates the server would compute the same distances over and over.
+We remember each result for ALONG_MEMO_SECONDS, keyed by route
+(the route_cache.Route object), position (rounded to about a meter),
+direction of travel (in one of MEMO_DIRECTIONS bins), and the
+rider's last reported distance (to the nearest km).  At most
+ALONG_MEMO_SIZE results are kept, evicting the least recently used
+(a route_cache.LRU).  A route reloaded by the route cache is a new
+object, so results for the old one are never used again.
+"""
+
+import math
+import time
+
+import config
+import route_cache
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+# Configurable ...
+ALONG_MEMO_SIZE = int(config.get("along_memo_size"))
+ALONG_MEMO_SECONDS = float(config.get("along_memo_seconds"))
+
+# Quantization of memo keys
+MEMO_DEGREES = 0.00001     # About a meter of latitude
+MEMO_DIRECTIONS = 32       # Bins of direction of travel
+MEMO_KM = 1.0              # Of the prior distance hint
+
+
+class DistanceMemo(route_cache.LRU):
+    """Least-recently-used memo of results, each expiring
+    ttl_seconds after it was computed.  Entries are (expires,
+    route, value).
+    """
+
+    def __init__(self, max_entries, ttl_seconds):
+        super().__init__(max_entries)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key, route, compute):
+        """The value of compute(), from the memo if we computed it for
+        key on route less than ttl_seconds ago.  Holding route keeps
+        its id (part of the key) from being reused while remembered.
+        """
+        now = time.monotonic()
+        entry = self.lookup(key, lambda entry: entry[0] > now)
+        if entry is not None:
+            return entry[2]
+        value = compute()
+        self.store(key, (now + self.ttl_seconds, route, value))
+        return value
+
+    def stats(self):
+        stats = super().stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(ttl_seconds=self.ttl_seconds,
+                     hit_rate=stats["hits"] / lookups if lookups else 0.0,
+                     expirations=stats.pop("invalidations"))
+        return stats
+
+
+def memo_key(route, lat, lon, prior=None, hint_km=None):
+    """Key for an observation at (lat, lon) on route, travelling
+    from prior (lat, lon) if known, with the rider last reported at
+    hint_km if known.
+    """
+    direction = None
+    if prior is not None:
+        prior_lat, prior_lon = prior
+        north = lat - prior_lat
+        east = (lon - prior_lon) * math.cos(math.radians(lat))
+        if north or east:
+            angle = math.atan2(north, east) % (2 * math.pi)
+            direction = int(angle / (2 * math.pi) * MEMO_DIRECTIONS) \
+                        % MEMO_DIRECTIONS
+    if hint_km is not None:
+        hint_km = round(hint_km / MEMO_KM)
+    return (id(route), round(lat / MEMO_DEGREES), round(lon / MEMO_DEGREES),
+            direction, hint_km)
+
+
+# Performed once at instantiation; shared by all requests
+# in this process
+memo = DistanceMemo(ALONG_MEMO_SIZE, ALONG_MEMO_SECONDS)
+
+def get(route, lat, lon, prior, hint_km, compute):
+    """compute(), memoized for an observation as in memo_key"""
+    return memo.get(memo_key(route, lat, lon, prior, hint_km),
+                    route, compute)
+
+def stats():
+    return memo.stats()
@@ -0,0 +1,265 @@
+#! /usr/bin/env python3
+#
+"""
+Benchmark measure.py over every shipped route (command line tool).
+
+For each static/routes/*_dists.json we generate the same synthetic
+observations every run (seeded by route name): points on the route,
+near it (within MAX_DEVIANCE_METERS), and off it, each with and
+without a prior position a little way back along the route.  We
+time interpolate_route_distance searching the whole route ("full"),
+with a SegmentGrid ("grid"), and with --raster a RouteRaster
+("raster"), and time track_to_utm on the route's _points.json.
+
+For each route we report percentiles of lookup time, how many
+segments each lookup measured and skipped, and the memory the
+loaded route (with its grid) takes.  --save writes the results as a
+JSON baseline; --compare reads one and exits with status 1 if any
+median or 90th percentile time has grown by more than --tolerance.
+
+usage: python3 bench_measure.py --save baseline.json
+       python3 bench_measure.py --compare baseline.json
+"""
+
+import os
+import sys
+import gc
+import glob
+import json
+import math
+import time
+import zlib
+import random
+import argparse
+import tracemalloc
+
+import utm
+
+import measure
+import route_cache
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+ROUTES_DIR = os.path.join("static", "routes")
+OBSERVATIONS = 50          # Of each kind, with and without prior
+PRIOR_BACK_KM = 0.3        # How far back along the route the prior is
+MIN_OFF_METERS = 3000      # Range of distance of "off" observations
+MAX_OFF_METERS = 10000
+PERCENTILES = (50, 90, 99)
+
+
+def getargs():
+    """Return arguments as a NameSpace object"""
+    parser = argparse.ArgumentParser("Benchmark distance along route")
+    parser.add_argument("routes", nargs="*",
+                        help="Distances files (default all shipped routes)")
+    parser.add_argument("--observations", type=int, default=OBSERVATIONS,
+                        help="Observations of each kind per route")
+    parser.add_argument("--raster", action="store_true",
+                        help="Also build and time route rasters")
+    parser.add_argument("--save", dest="save_path", default=None,
+                        help="Write results to this JSON baseline")
+    parser.add_argument("--compare", dest="baseline_path", default=None,
+                        help="Compare results to this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Slowdown ratio to report as a regression")
+    return parser.parse_args()
+
+
+def observations(utm_path, zone, seed, count):
+    """List of (kind, lat, lon, prior) for synthetic observations
+    on, near, and off the route, half of them with priors.
+    """
+    rand = random.Random(seed)
+    obs = [ ]
+    if len(utm_path) < 2:
+        return obs
+    for kind in ["on", "near", "off"]:
+        for with_prior in [False, True]:
+            for _ in range(count):
+                seg = rand.randrange(len(utm_path) - 1)
+                frac = rand.random()
+                offset = 0.0
+                if kind == "near":
+                    offset = rand.uniform(0, measure.MAX_DEVIANCE_METERS)
+                elif kind == "off":
+                    offset = rand.uniform(MIN_OFF_METERS, MAX_OFF_METERS)
+                angle = rand.uniform(0, 2 * math.pi)
+                off_east = offset * math.cos(angle)
+                off_north = offset * math.sin(angle)
+                east, north = _back_along(utm_path, seg, frac, 0.0)
+                lat, lon = utm.to_latlon(east + off_east, north + off_north,
+                                         zone, northern=True, strict=False)
+                prior = None
+                if with_prior:
+                    # Same offset, a little way back along the route
+                    east, north = _back_along(utm_path, seg, frac,
+                                              PRIOR_BACK_KM)
+                    prior = utm.to_latlon(east + off_east, north + off_north,
+                                          zone, northern=True, strict=False)
+                obs.append((kind, lat, lon, prior))
+    return obs
+
+def _back_along(utm_path, seg, frac, back_km):
+    """(east, north) of the point back_km before fraction frac of
+    segment seg of utm_path (or the start of the route)
+    """
+    km_1, km_2 = utm_path[seg][2], utm_path[seg + 1][2]
+    target_km = km_1 + frac * (km_2 - km_1) - back_km
+    while seg > 0 and utm_path[seg][2] > target_km:
+        seg -= 1
+    east_1, north_1, km_1 = utm_path[seg]
+    east_2, north_2, km_2 = utm_path[seg + 1]
+    if km_2 > km_1:
+        frac = min(max((target_km - km_1) / (km_2 - km_1), 0.0), 1.0)
+    else:
+        frac = 0.0
+    return (east_1 + frac * (east_2 - east_1),
+            north_1 + frac * (north_2 - north_1))
+
+
+def percentiles(times):
+    """Percentiles (and max) of times in seconds, as milliseconds"""
+    ordered = sorted(times)
+    result = { }
+    for p in PERCENTILES:
+        i = min(len(ordered) - 1, int(math.ceil(p / 100 * len(ordered))) - 1)
+        result["p{}".format(p)] = round(ordered[max(i, 0)] * 1000, 4)
+    result["max"] = round(ordered[-1] * 1000, 4)
+    return result
+
+def time_lookups(obs, route, zone, index):
+    """Time interpolate_route_distance for each observation; returns
+    a summary dict
+    """
+    times = [ ]
+    scanned = 0
+    segment_count = len(route) - 1
+    for kind, lat, lon, prior in obs:
+        if index is not None:
+            east, north, _, _ = utm.from_latlon(lat, lon,
+                                                force_zone_number=zone)
+            travel_east, travel_north = 0, 0
+            if prior is not None:
+                prior_east, prior_north, _, _ = utm.from_latlon(
+                    prior[0], prior[1], force_zone_number=zone)
+                travel_east, travel_north = (east - prior_east,
+                                             north - prior_north)
+            scanned += len(index.candidates(east, north,
+                                            travel_east, travel_north))
+        else:
+            scanned += segment_count
+        start = time.perf_counter()
+        measure.interpolate_route_distance(lat, lon, route, zone, prior,
+                                           index=index)
+        times.append(time.perf_counter() - start)
+    summary = percentiles(times)
+    summary["segments_scanned"] = round(scanned / len(obs), 1)
+    summary["segments_skipped"] = round(segment_count - scanned / len(obs), 1)
+    return summary
+
+def loaded_kb(dists_path):
+    """Memory held by a route loaded as the route cache loads it"""
+    gc.collect()
+    tracemalloc.start()
+    route = route_cache._load_distances(dists_path)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del route
+    return round(current / 1024, 1)
+
+def bench_route(dists_path, count, raster=False):
+    """Benchmark results for one distances file"""
+    name = os.path.basename(dists_path)[:-len("_dists.json")]
+    with open(dists_path) as f:
+        track_obj = json.load(f)
+    utm_path, zone = track_obj["path"], track_obj["zone"]
+    obs = observations(utm_path, zone, zlib.crc32(name.encode("utf-8")),
+                       count)
+    result = { "segments": max(len(utm_path) - 1, 0),
+               "observations": len(obs),
+               "memory_kb": loaded_kb(dists_path),
+               "lookup_ms": { } }
+    if not obs:
+        return name, result
+    route = measure.prepare_route(utm_path)
+    indexes = { "full": None, "grid": measure.SegmentGrid(utm_path) }
+    if raster and measure.np is not None:
+        start = time.perf_counter()
+        indexes["raster"] = measure.build_route_raster(route)
+        result["raster_build_s"] = round(time.perf_counter() - start, 3)
+    for mode, index in indexes.items():
+        result["lookup_ms"][mode] = time_lookups(obs, route, zone, index)
+
+    points_path = dists_path[:-len("_dists.json")] + "_points.json"
+    if os.path.exists(points_path):
+        with open(points_path) as f:
+            points = json.load(f)
+        start = time.perf_counter()
+        measure.track_to_utm(points)
+        result["track_to_utm_ms"] = round(
+            (time.perf_counter() - start) * 1000, 3)
+    return name, result
+
+
+def compare(results, baseline, tolerance):
+    """List of regressions (descriptions) of results from baseline"""
+    regressions = [ ]
+    for name, result in sorted(results.items()):
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for mode, times in result["lookup_ms"].items():
+            before_times = before["lookup_ms"].get(mode)
+            if before_times is None:
+                continue
+            for stat in ["p50", "p90"]:
+                if (before_times[stat] > 0
+                        and times[stat] > tolerance * before_times[stat]):
+                    regressions.append("{} {} {}: {:.3f}ms, was {:.3f}ms"
+                                       .format(name, mode, stat, times[stat],
+                                               before_times[stat]))
+    return regressions
+
+def report(results):
+    print("{:24} {:>6} {:>9} {:>7} {:>9} {:>9} {:>9} {:>8}".format(
+        "route", "segs", "mem KB", "mode", "p50 ms", "p90 ms", "p99 ms",
+        "scanned"))
+    for name, result in sorted(results.items()):
+        for mode, times in result["lookup_ms"].items():
+            print("{:24} {:>6} {:>9} {:>7} {:>9.3f} {:>9.3f} {:>9.3f} {:>8}"
+                  .format(name, result["segments"], result["memory_kb"],
+                          mode, times["p50"], times["p90"], times["p99"],
+                          times["segments_scanned"]))
+        if "track_to_utm_ms" in result:
+            print("{:24} track_to_utm {:.3f}ms".format(
+                "", result["track_to_utm_ms"]))
+
+def main():
+    args = getargs()
+    paths = args.routes or sorted(
+        glob.glob(os.path.join(ROUTES_DIR, "*_dists.json")))
+    results = { }
+    for path in paths:
+        name, result = bench_route(path, args.observations, args.raster)
+        results[name] = result
+    report(results)
+    if args.save_path:
+        with open(args.save_path, "w") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+        log.info("Saved baseline {}".format(args.save_path))
+    if args.baseline_path:
+        with open(args.baseline_path) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print("REGRESSION {}".format(regression))
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
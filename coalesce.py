@@ -0,0 +1,71 @@
+"""
+Coalescing of concurrent refreshes of the same thing.
+
+Within a process, a SingleFlight lets one thread run the refresh of
+a key while other threads asking for the same key wait for, and
+share, its result.  Across processes and hosts, the refresher also
+holds a lease from storage.py, so that other workers serve what is
+cached rather than querying the same feed again.
+"""
+
+import threading
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+
+class _Call(object):
+    """One call in flight, and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """At most one call of do(key, ...) runs at a time for each key;
+    callers that arrive meanwhile wait and get the same result (or
+    exception).  Thread safe.
+    """
+
+    def __init__(self):
+        self._calls = { }
+        self._lock = threading.Lock()
+        self.calls = 0        # Calls that ran
+        self.joined = 0       # Calls that shared another's result
+
+    def do(self, key, fn, *args):
+        """fn(*args), or the result of the call already running for key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                self.joined += 1
+        if not leader:
+            log.debug("Joining refresh of {} in flight".format(key))
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return { "calls": self.calls, "joined": self.joined,
+                     "in_flight": len(self._calls) }
@@ -1,6 +1,6 @@
 """
 Read spreadsheet (which may be uploaded) with device assignments.
-Soon:  Copy to MongoDB databasse.
+Saved in the database (see storage.py).
 """
 
 from openpyxl import Workbook
@@ -10,10 +10,8 @@ from openpyxl import load_workbook
 
 # Configured variables
 import config
-from pymongo import MongoClient
-MONGO_URL = config.get("mongo_url")
+import storage
 
-MONGO_URL = config.get("mongo_url")
 URL = config.get("trackleaders_url")
 
 import logging
@@ -22,10 +20,8 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
 # Performed once at instantiation
-# Database collection
-client = MongoClient(MONGO_URL)
-db = client.enroute
-collection = db.devices   # TrackLeaders tracks
+# Database table
+devices = storage.table("devices", "kind")   # Device assignments
 
 
 def read_assignments(filename):
@@ -66,11 +62,11 @@ def read_assignments(filename):
 
 def save_assignments(assignments: dict):
     """Save configuration in database"""
-    collection.replace_one({"kind": "assignments"}, assignments, upsert=True)
+    devices.put("assignments", assignments)
 
 def get_assignments() -> dict:
     """Get configuration from database"""
-    assignments = collection.find_one({"kind": "assignments"})
+    assignments = devices.get("assignments")
     return assignments
 
 def configure(file_name: str):
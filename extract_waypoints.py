@@ -9,9 +9,8 @@ export.   If you are processing with gpx_simplify.py anyway, there is
 essentially no extra cost in initially dumping the GPX with extra waypoints.
 """
 
-import gpxpy
-import gpxpy.parser 
 import sys
+import gpx_stream
 
 USAGE = 'usage: python3 extract_waypoints.py "summit" routes/mountains.gpx'
 
@@ -22,15 +21,9 @@ if len(sys.argv) != 3:
 pattern = sys.argv[1].lower()
 path = sys.argv[2]
 
-gpx_file = open( path, 'r' )
-parser = gpxpy.parser.GPXParser( gpx_file )
-gpx = parser.parse()
-gpx_file.close()
+gpx = gpx_stream.read(path, waypoint_pattern=pattern, track_points=False)
 
 for waypoint in gpx.waypoints:
-    desc = waypoint.comment or waypoint.description or "No description"
-    if (pattern in waypoint.name.lower() or
-        pattern in desc.lower()):
-        print("{},{},'{}','{}'".format(
-            waypoint.latitude, waypoint.longitude,
-            waypoint.name, desc))
+    print("{},{},'{}','{}'".format(
+        waypoint.lat, waypoint.lon,
+        waypoint.name, waypoint.desc))
@@ -9,13 +9,19 @@ import flask
 from werkzeug.utils import secure_filename
 
 import json
+import hashlib
+import threading
+from collections import OrderedDict
 import logging
 import config
 
 import arrow      
 
 import spot
-import measure
+import route_cache
+import along_memo
+import progress
+import upstream
 import event_reader
 # import device_assignments
 # import trackleaders
@@ -40,6 +46,25 @@ ALLOWED_EXTENSIONS = set(['xlsx'])
 SUSAN_PW = config.get("susan_pw")
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+# With a background poller (poller.py) keeping feeds fresh, we
+# query Spot ourselves only for feeds it has missed
+if config.get("background_polling") == True:
+    FEED_STALE_MINUTES = int(config.get("poll_fallback_minutes"))
+else:
+    FEED_STALE_MINUTES = spot.QUERY_INTERVAL_MINUTES
+
+# Serialized /_riders responses by ETag, least recently used first.
+# Spectators polling between feed updates get the same bytes (or
+# 304 Not Modified) without our serializing them again.
+RIDERS_PAYLOADS_SIZE = 128
+riders_payloads = OrderedDict()
+riders_payloads_lock = threading.Lock()
+
+# Riders' routes of recent events, by events/<name>.csv path, read
+# again only when the file changes
+EVENT_ROUTES_SIZE = 16
+event_routes = route_cache.RouteCache(EVENT_ROUTES_SIZE)
+
 ###
 # Pages
 ###
@@ -250,24 +275,15 @@ def _along():
         lon = flask.request.args.get('lng', None, type=float)
         prior_lat = flask.request.args.get('prior_lat', None, type=float)
         prior_lng = flask.request.args.get('prior_lng', None, type=float)
+        prior_km = flask.request.args.get('prior_km', None, type=float)
         app.logger.debug("lat, lon = {}, {}".format(lat, lon))
         track_file = flask.request.args.get('track', '', type=str)
         file_path = os.path.join("static", "routes",
-                                     track_file)
-        with open(file_path) as f:
-            track_obj = json.load(f)
-            assert type(track_obj) == dict, "Distances file must be dict"
-            assert "path" in track_obj and "zone" in track_obj, \
-                 "Distances file must be object with UTM path and zone"
-            if prior_lat or prior_lng:
-                dist = measure.interpolate_route_distance(lat, lon,
-                                        track_obj["path"], track_obj["zone"],
-                                        (prior_lat, prior_lng))
-            else: 
-                dist = measure.interpolate_route_distance(lat, lon,
-                        track_obj["path"], track_obj["zone"])
-            app.logger.debug("Interpolated distance {:4,f}".format(dist))
-            return flask.jsonify(result=dist)
+                                     secure_filename(track_file))
+        route = route_cache.distances(file_path)
+        dist = along_distance(route, lat, lon, prior_lat, prior_lng, prior_km)
+        app.logger.debug("Interpolated distance {:4,f}".format(dist))
+        return flask.jsonify(result=dist)
     except FileNotFoundError as e: 
         app.logger.warn("File {} not found".format(track_file))
         return flask.jsonify(result=0)
@@ -275,6 +291,69 @@ def _along():
         app.logger.warn("_along is broken... {}".format(e))
         raise
         # return flask.jsonify(result=0)
+
+
+@app.route('/_along_batch', methods=['POST'])
+def _along_batch():
+    """AJAX responder to a batch of requests for distance along path. 
+    Expects a JSON body 
+       { observations: [ { track: "x_dists.json", lat: 44.1, lng: -123.1,
+                           prior_lat: 44.0, prior_lng: -123.2,
+                           prior_km: 87.5 }, ... ] }
+    (prior_lat, prior_lng and prior_km optional) and responds 
+       { result: [ distance, ... ] }
+    with distances in the same order, as _along would report each. 
+    Each distances file is looked up once per batch.  A body that
+    is not of that form gets 400 Bad Request. 
+    """
+    body = flask.request.get_json(force=True, silent=True)
+    if not isinstance(body, dict) or not isinstance(
+            body.get("observations"), list):
+        flask.abort(400)
+    try:
+        observations = [ _batch_observation(obs)
+                         for obs in body["observations"] ]
+    except (KeyError, TypeError, ValueError):
+        app.logger.debug("Bad observation in batch")
+        flask.abort(400)
+    app.logger.debug("Ajax request for {} distances along path"
+                         .format(len(observations)))
+    routes = { }
+    result = [ ]
+    for obs in observations:
+        track_file = obs["track"]
+        if track_file not in routes:
+            file_path = os.path.join("static", "routes",
+                                         secure_filename(track_file))
+            try:
+                routes[track_file] = load_distances(file_path)
+            except FileNotFoundError:
+                routes[track_file] = None
+        route = routes[track_file]
+        if route is None:
+            result.append(0)
+            continue
+        result.append(along_distance(route, obs["lat"], obs["lng"],
+                                     obs["prior_lat"], obs["prior_lng"],
+                                     obs["prior_km"]))
+    return flask.jsonify(result=result)
+
+def _batch_observation(obs):
+    """One observation of a /_along_batch body, with numbers as float
+    (None for priors not given).  Raises KeyError, TypeError or
+    ValueError if it is malformed.
+    """
+    if not isinstance(obs, dict):
+        raise TypeError("Observation is not an object")
+    track_file = obs.get("track", "")
+    if not isinstance(track_file, str):
+        raise TypeError("Track is not a string")
+    checked = { "track": track_file,
+                "lat": float(obs["lat"]), "lng": float(obs["lng"]) }
+    for prior in [ "prior_lat", "prior_lng", "prior_km" ]:
+        value = obs.get(prior)
+        checked[prior] = None if value is None else float(value)
+    return checked
         
 
 @app.route('/_get_route', methods=['GET'])
@@ -284,23 +363,73 @@ def get_route():
     """
     app.logger.debug("Ajax request for route ")
     route = flask.request.args.get("route", type=str)
+    if not route:
+        flask.abort(400)
     app.logger.debug("Attempting send from static/routes/{}"
                          .format(route))
-    return flask.send_from_directory('static/routes', route)
+    file_path = os.path.join("static", "routes", secure_filename(route))
+    try:
+        route_points = route_cache.points(file_path)
+    except FileNotFoundError:
+        flask.abort(404)
+    except ValueError as e:
+        # Not a points file
+        app.logger.warn("Route {} is not points: {}".format(route, e))
+        flask.abort(404)
+    response = flask.Response(route_points.text, mimetype="application/json")
+    # As send_from_directory would, so browsers can revalidate
+    response.set_etag(route_points.etag)
+    response.last_modified = route_points.mtime
+    return response.make_conditional(flask.request)
+
+
+@app.route('/_route_cache_stats', methods=['GET'])
+def route_cache_stats():
+    """Hit, miss, eviction and invalidation counts of this process's
+    route cache and memo of distances along routes
+    """
+    stats = route_cache.stats()
+    stats["along_memo"] = along_memo.stats()
+    return flask.jsonify(stats)
+
+
+@app.route('/_upstream_stats', methods=['GET'])
+def upstream_stats():
+    """Request counts and latencies to Spot and TrackLeaders from
+    this process
+    """
+    return flask.jsonify(upstream.stats())
 
 
 @app.route('/_riders', methods=['GET'])
 def get_riders():
     """
-    Ajax request for rider tracks
+    Ajax request for rider tracks.  With event=<name>, riders'
+    routes are taken from events/<name>.csv, and the latest 
+    observation of each rider on a route has dist_km, its distance
+    along the route. 
     """
     app.logger.debug("Ajax request for riders ")
-    riders = flask.request.args.getlist("feed", type=str)
+    # In a canonical order, so any order of the same feeds gets
+    # the same response (and ETag)
+    riders = sorted(set(flask.request.args.getlist("feed", type=str)))
+    event_name = flask.request.args.get("event", None, type=str)
     app.logger.debug("Getting feeds for {}".format(riders))
-    tracks = spot.get_feeds(riders)
-    # return jsonify(result=result)
-    app.logger.debug("Sending tracks: |{}|".format(tracks))
-    return json.dumps(tracks)
+    routes = { }
+    if event_name:
+        routes = rider_routes(secure_filename(event_name))
+    tracks = spot.get_feeds(riders, routes, FEED_STALE_MINUTES)
+    etag = riders_etag(riders, event_name, routes, tracks)
+    if flask.request.if_none_match.contains(etag):
+        app.logger.debug("Tracks not modified")
+        response = flask.Response(status=304)
+    else:
+        response = flask.Response(riders_payload(etag, tracks, routes),
+                                  mimetype="application/json")
+    response.set_etag(etag)
+    # Browsers may keep the response, but must ask whether it changed
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 # @app.route('/_tl_riders', methods=['GET'])
@@ -338,6 +467,56 @@ def get_riders():
 #
 ##################
 
+def rider_routes(event_name):
+    """Map from tracker id to route of the riders of event_name, as
+    read from events/<name>.csv when it last changed
+    """
+    def load(path):
+        return progress.event_routes(event_reader.EventRecord(event_name))
+    try:
+        return event_routes.get("events/{}.csv".format(event_name), load)
+    except FileNotFoundError:
+        return { }
+
+def riders_etag(riders, event_name, routes, tracks):
+    """Strong ETag of the /_riders response for riders (sorted) in
+    event_name, which changes whenever a rider's route in routes
+    changes, or a track is queried again, has a new message, or is
+    measured along a route.
+    """
+    digest = hashlib.sha1()
+    routes_for_riders = [ routes.get(rider) for rider in riders ]
+    digest.update(json.dumps([ riders, event_name, routes_for_riders ]
+                             ).encode("utf-8"))
+    for track in tracks:
+        latest = track["latest"]
+        digest.update(json.dumps(
+            [ track["id"], track.get("last_query_time"),
+              track.get("newest_message_id"), latest.get("dateTime"),
+              latest.get("route_km") ], sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+def riders_payload(etag, tracks, routes):
+    """Serialized tracks (with dist_km on routes) for etag, from
+    riders_payloads if we have made it before
+    """
+    with riders_payloads_lock:
+        payload = riders_payloads.get(etag)
+        if payload is not None:
+            riders_payloads.move_to_end(etag)
+            return payload
+    for track in tracks:
+        route_km = track["latest"].get("route_km", { })
+        if track["id"] in routes and routes[track["id"]] in route_km:
+            track["latest"]["dist_km"] = route_km[routes[track["id"]]]
+    app.logger.debug("Sending tracks: |{}|".format(tracks))
+    payload = json.dumps(tracks).encode("utf-8")
+    with riders_payloads_lock:
+        riders_payloads[etag] = payload
+        while len(riders_payloads) > RIDERS_PAYLOADS_SIZE:
+            riders_payloads.popitem(last=False)
+    return payload
+
 def publish_globals():
     """Global values that should be available through
     the g object. 
@@ -349,11 +528,7 @@ def load_points(file_path):
     right into the web page. 
     """
     try: 
-        with open(file_path) as f:
-            points_obj = json.load(f)
-            assert type(points_obj) == list, "Expecting an array of points"
-            return points_obj
-            
+        return route_cache.points(file_path).points
     except FileNotFoundError as e: 
         app.logger.warn("File {} not found".format(file_path))
         raise
@@ -362,21 +537,33 @@ def load_points(file_path):
         raise
 
 def load_distances(file_path): 
-    """UTM paths with distances"""
+    """UTM paths with distances, as a route_cache.Route"""
     try: 
-        with open(file_path) as f:
-            track_obj = json.load(f)
-            assert type(track_obj) == dict, "Distances file must be dict"
-            assert "path" in track_obj and "zone" in track_obj, \
-                 "Distances file must be object with UTM path and zone"
-            return track_obj
+        return route_cache.distances(file_path)
     except FileNotFoundError as e: 
-        app.logger.warn("File {} not found".format(track_file))
-        return flask.jsonify(result=0)
+        app.logger.warn("File {} not found".format(file_path))
+        raise
     except Exception as e:
-        app.logger.warn("_along is broken... {}".format(e))
+        app.logger.warn("load_distances is broken... {}".format(e))
         raise
-        # return flask.jsonify(result=0)
+
+def along_distance(route, lat, lon, prior_lat=None, prior_lng=None,
+                   prior_km=None):
+    """Distance along route (a route_cache.Route) for an 
+    observation, filtered by direction only if a prior position
+    is known.  Spot trackers report no prior as 0,0.  If prior_km
+    (the last distance we reported for this rider) is given, the
+    search starts near it. 
+    """
+    if prior_lat or prior_lng:
+        prior = (float(prior_lat), float(prior_lng))
+    else:
+        prior = None
+    if prior_km is not None and float(prior_km) >= 0:
+        hint_km = float(prior_km)
+    else:
+        hint_km = None
+    return progress.along_distance(route, lat, lon, prior, hint_km)
 
 
 
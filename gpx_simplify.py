@@ -13,6 +13,9 @@ import gpxpy
 import gpxpy.gpx
 import json
 
+import gpx_stream
+import measure
+
 import logging
 logging.basicConfig(format='%(levelname)s:%(message)s',
                         level=logging.DEBUG)
@@ -34,6 +37,10 @@ def getargs():
                             help="Output as JSON list of points (default gpx)")
     parser.add_argument("--delta", dest="delta", type=int, default=100,
                             help="Max deviation from input route, in meters")
+    parser.add_argument("--dists", dest="dists_file",
+                            type=argparse.FileType(mode='w'),
+                            help="With --points, also write json of utm with"
+                            + " distance measured before simplifying")
     argvals = parser.parse_args()
     return argvals
 
@@ -49,19 +56,55 @@ def points(gpx_obj):
                 li.append([point.latitude, point.longitude])
     return li
                                
-def main():
-    args = getargs()
-    gpx = gpxpy.parse(args.infile)
-    delta = args.delta
+def simplified(gpx_file, delta):
+    """
+    Parse and simplify GPX from gpx_file (an open file or text), 
+    keeping track points within delta meters of the original route.
+    Returns the simplified gpx object. 
+    """
+    gpx = gpxpy.parse(gpx_file)
     log.debug("{} points before simplification".format(len(points(gpx))))
     gpx.simplify(delta)
     log.debug("{} points after simplification".format(len(points(gpx))))
+    return gpx
+
+def simplified_route(gpx_file, delta):
+    """
+    Track points from gpx_file (a path or open file), simplified in 
+    projected (UTM) coordinates so that each track segment stays within
+    delta meters of the original.  Cumulative distances are measured on
+    the full track before simplifying, so cutting corners does not 
+    shorten the route.  Returns (points, utm_path, zone), with points 
+    as [[lat, lon], ...] and utm_path and zone as from track_to_utm. 
+    """
+    track = gpx_stream.read(gpx_file)
+    log.debug("{} points before simplification".format(len(track)))
+    track_points = track.points()
+    utm_path, zone = measure.track_to_utm(track_points)
+    kept = [ ]
+    bounds = list(track.segment_starts) + [ len(track) ]
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        east = [ pt[0] for pt in utm_path[start:end] ]
+        north = [ pt[1] for pt in utm_path[start:end] ]
+        kept.extend(start + i
+                    for i in measure.douglas_peucker(east, north, delta))
+    log.debug("{} points after simplification".format(len(kept)))
+    return ([ track_points[i] for i in kept ],
+            [ utm_path[i] for i in kept ], zone)
+
+def main():
+    args = getargs()
     if args.format == "points": 
-        print(json.dumps(points(gpx)), file=args.outfile)
+        li, utm_path, zone = simplified_route(args.infile.buffer, args.delta)
+        print(json.dumps(li), file=args.outfile)
+        if args.dists_file:
+            json.dump({ "zone": zone, "path": utm_path }, args.dists_file)
     else: 
+        gpx = simplified(args.infile, args.delta)
         print(gpx.to_xml(), file=args.outfile)
 
-main()
+if __name__ == "__main__":
+    main()
 
 
 
@@ -0,0 +1,94 @@
+"""
+Read track points and waypoints from a GPX file as a stream
+(for route preparation tools). 
+
+Unlike gpxpy, we do not build an object for every element of the
+file.  Track point coordinates go straight into compact arrays as 
+they are parsed, and each element is discarded once read, so peak 
+memory stays small even for big RWGPS exports with cues as waypoints. 
+"""
+
+import xml.etree.ElementTree as ET
+from array import array
+from collections import namedtuple
+
+Waypoint = namedtuple("Waypoint", ["lat", "lon", "name", "desc"])
+
+
+class GpxTrack(object):
+    """Track points of all track segments in a GPX file, in order, 
+    and the waypoints that matched a pattern. 
+    segment_starts[i] is the index in lats and lons of the first 
+    point of segment i. 
+    """
+
+    def __init__(self):
+        self.lats = array('d')
+        self.lons = array('d')
+        self.segment_starts = array('l')
+        self.waypoints = [ ]
+
+    def __len__(self):
+        return len(self.lats)
+
+    def points(self):
+        """All track points as [[lat, lon], [lat, lon], ... ]"""
+        return [ [lat, lon] for lat, lon in zip(self.lats, self.lons) ]
+
+    def segments(self):
+        """Track points of each segment, as (lats, lons) arrays"""
+        bounds = list(self.segment_starts) + [ len(self.lats) ]
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            yield self.lats[start:end], self.lons[start:end]
+
+
+def _local(tag):
+    """Tag without its XML namespace (GPX 1.0 and 1.1 differ)"""
+    return tag.rsplit("}", 1)[-1]
+
+def read(gpx_file, waypoint_pattern=None, track_points=True):
+    """
+    Stream a GPX file (path or open binary/text file) into a GpxTrack.
+    Waypoints are kept only if waypoint_pattern is given, and only 
+    those whose name or description (comment, if present) contains 
+    it, ignoring case.  With track_points=False, only waypoints are read. 
+    """
+    track = GpxTrack()
+    if waypoint_pattern is not None:
+        waypoint_pattern = waypoint_pattern.lower()
+    parents = [ ]
+    for event, elem in ET.iterparse(gpx_file, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            if track_points and _local(elem.tag) == "trkseg":
+                track.segment_starts.append(len(track.lats))
+            continue
+        parents.pop()
+        tag = _local(elem.tag)
+        if tag == "trkpt":
+            if track_points:
+                track.lats.append(float(elem.get("lat")))
+                track.lons.append(float(elem.get("lon")))
+        elif tag == "wpt":
+            if waypoint_pattern is not None:
+                _match_waypoint(track, elem, waypoint_pattern)
+        elif tag not in ("trkseg", "trk"):
+            # Children of points are read with their parent
+            continue
+        # Done with this element; drop it so the tree stays small.
+        # It is always the most recent child of its parent.
+        elem.clear()
+        if parents:
+            del parents[-1][-1]
+    return track
+
+def _match_waypoint(track, elem, pattern):
+    fields = { }
+    for child in elem:
+        fields[_local(child.tag)] = child.text or ""
+    name = fields.get("name", "")
+    desc = fields.get("cmt") or fields.get("desc") or "No description"
+    if pattern in name.lower() or pattern in desc.lower():
+        track.waypoints.append(Waypoint(float(elem.get("lat")),
+                                        float(elem.get("lon")),
+                                        name, desc))
@@ -14,6 +14,13 @@ import geopy.distance
 import utm
 import math
 import json
+import struct
+import bisect
+
+try:
+    import numpy as np
+except ImportError:
+    np = None   # interpolate_route_distance falls back to pure Python
 
 import argparse
 
@@ -32,6 +39,45 @@ log.setLevel(logging.INFO)
 #
 MAX_DEVIANCE_METERS = 2000        # 2km
 
+# With a hint of the rider's last known progress, first search
+# this far behind (e.g., backtracking to a control) ... 
+HINT_BEHIND_KM = 5
+# ... and this far ahead (several hours of riding between updates)
+HINT_AHEAD_KM = 100
+
+# Cell size of the SegmentGrid index.  With cells no smaller than
+# the deviance buffer, a route's segments are listed in only a few
+# cells each. 
+#
+GRID_CELL_METERS = MAX_DEVIANCE_METERS
+
+# Packed binary distances file (_dists.bin): a little-endian header
+#   magic, format version, UTM zone, point count, segment count,
+#   bounding box (min east, min north, max east, max north)
+# followed by float64 columns of easting, northing and cumulative km
+# per point, then unit east, unit north and length (meters) per segment.
+#
+BINARY_MAGIC = b"ENRT"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sHHII4d")
+
+# Route raster (_raster.bin), an optional precomputed index for
+# busy routes:  cell size in meters, and number of direction-of-travel
+# bins (plus one more for "direction unknown") per cell.  The header
+# holds magic, format version, cell size, first column and row, rows,
+# cells, direction bins and candidate count; then int64 cell keys, 
+# int32 candidate offsets per bin and cell, and int32 segment indexes.
+#
+RASTER_CELL_METERS = 100
+RASTER_DIRECTIONS = 4
+RASTER_MAGIC = b"ENRR"
+RASTER_VERSION = 1
+RASTER_HEADER = struct.Struct("<4sHHdqqqqq")
+
+# Iteration limit for Vincenty distance, as in geopy
+#
+VINCENTY_ITERATIONS = 20
+
 # --------------------------------------
 
 
@@ -146,6 +192,10 @@ def track_to_utm(track):
     with a zone --- we choose one UTM zone and make sure all eastings and 
     northings are in that zone, so that distance between points can be 
     computed directly from UTM values.
+
+    With numpy, the whole track is projected and measured in bulk 
+    (see utm_columns); cumulative distances agree with the 
+    point-by-point computation to within 1e-6 km before rounding. 
     """
     if len(track) == 0:
         return track, 10 
@@ -154,6 +204,14 @@ def track_to_utm(track):
     mid_lat, mid_lon = track_centerpoint(track)
     _, _, utm_zone, _ = utm.from_latlon(mid_lat, mid_lon)
 
+    if np is not None:
+        eastings, northings, cum_km = utm_columns(track, utm_zone)
+        utm_path = [ (round(easting), round(northing), round(tot_km, 2))
+                     for easting, northing, tot_km
+                     in zip(eastings.tolist(), northings.tolist(),
+                            cum_km.tolist()) ]
+        return utm_path, utm_zone
+
     tot_km = 0 
     utm_path = [ ]
     prev = track[0]
@@ -172,7 +230,174 @@ def track_to_utm(track):
 
     return utm_path, utm_zone
 
-def interpolate_route_distance(lat, lon, utm_track, utm_zone, prior_obs=None):
+def utm_columns(track, utm_zone):
+    """Project track == [[lat, lon], [lat, lon], ... ] into utm_zone
+    in one array operation, and measure cumulative distance along it.
+    Returns arrays (eastings, northings, cumulative km), unrounded. 
+    Requires numpy. 
+    """
+    lat_lon = np.array(track, dtype=np.float64).reshape(-1, 2)
+    lats = lat_lon[:, 0]
+    lons = lat_lon[:, 1]
+    eastings, northings, _, _ = \
+      utm.from_latlon(lats, lons, force_zone_number=utm_zone)
+    seg_km = np.zeros(len(lats))
+    seg_km[1:] = dist_km_array(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    return eastings, northings, np.cumsum(seg_km)
+
+def dist_km_array(lat1, lon1, lat2, lon2):
+    """dist_km for arrays of point pairs (lat1[i], lon1[i]) -
+    (lat2[i], lon2[i]):  Vincenty on the WGS-84 ellipsoid, iterated for
+    all pairs at once as geopy does for one, falling back to great
+    circle distance for any pair that fails to converge. 
+    Requires numpy. 
+    """
+    major, minor, f = geopy.distance.ELLIPSOIDS["WGS-84"]
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(deg, dtype=np.float64))
+                              for deg in (lat1, lon1, lat2, lon2))
+    delta_lng = lon2 - lon1
+    reduced_lat1 = np.arctan((1 - f) * np.tan(lat1))
+    reduced_lat2 = np.arctan((1 - f) * np.tan(lat2))
+    sin_reduced1, cos_reduced1 = np.sin(reduced_lat1), np.cos(reduced_lat1)
+    sin_reduced2, cos_reduced2 = np.sin(reduced_lat2), np.cos(reduced_lat2)
+
+    lambda_lng = delta_lng.copy()
+    converged = np.zeros(lambda_lng.shape, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(VINCENTY_ITERATIONS + 1):
+            sin_lambda_lng = np.sin(lambda_lng)
+            cos_lambda_lng = np.cos(lambda_lng)
+            sin_sigma = np.sqrt(
+                (cos_reduced2 * sin_lambda_lng) ** 2 +
+                (cos_reduced1 * sin_reduced2 -
+                 sin_reduced1 * cos_reduced2 * cos_lambda_lng) ** 2)
+            cos_sigma = (sin_reduced1 * sin_reduced2 +
+                         cos_reduced1 * cos_reduced2 * cos_lambda_lng)
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(
+                sin_sigma == 0, 0.0,
+                cos_reduced1 * cos_reduced2 * sin_lambda_lng / sin_sigma)
+            cos_sq_alpha = 1 - sin_alpha ** 2
+            # cos_sq_alpha is 0 on the equatorial line
+            cos2_sigma_m = np.where(
+                cos_sq_alpha == 0, 0.0,
+                cos_sigma - 2 * sin_reduced1 * sin_reduced2 / cos_sq_alpha)
+            C = f / 16. * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+            lambda_prime = lambda_lng
+            lambda_lng = np.where(converged, lambda_prime,
+                delta_lng + (1 - C) * f * sin_alpha * (
+                    sigma + C * sin_sigma * (
+                        cos2_sigma_m + C * cos_sigma * (
+                            -1 + 2 * cos2_sigma_m ** 2))))
+            converged |= np.abs(lambda_lng - lambda_prime) <= 10e-12
+            if converged.all():
+                break
+
+    u_sq = cos_sq_alpha * (major ** 2 - minor ** 2) / minor ** 2
+    A = 1 + u_sq / 16384. * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    B = u_sq / 1024. * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = B * sin_sigma * (
+        cos2_sigma_m + B / 4. * (
+            cos_sigma * (-1 + 2 * cos2_sigma_m ** 2) -
+            B / 6. * cos2_sigma_m * (-3 + 4 * sin_sigma ** 2) *
+            (-3 + 4 * cos2_sigma_m ** 2)))
+    dist = minor * A * (sigma - delta_sigma)
+    dist[sin_sigma == 0] = 0.0     # Coincident points
+
+    if not converged.all():
+        log.warning("Vincenty failed to converge on {} segments; "
+                    "resorting to great circle".format(
+                        np.count_nonzero(~converged)))
+        d_lat = lat2 - lat1
+        hav = (np.sin(d_lat / 2) ** 2 +
+               np.cos(lat1) * np.cos(lat2) * np.sin(delta_lng / 2) ** 2)
+        great_circle = 2 * geopy.distance.EARTH_RADIUS * \
+          np.arcsin(np.sqrt(hav))
+        dist = np.where(converged, dist, great_circle)
+    return dist
+
+class SegmentGrid(object):
+    """Uniform grid index over the segments of a UTM path. 
+    Each cell lists (in path order) the segments whose bounding box,
+    buffered by MAX_DEVIANCE_METERS, overlaps the cell, so an 
+    observation need only be measured against the segments listed
+    in its own cell.  Segment i runs from utm_track[i] to utm_track[i+1].
+    Build once per route and pass to interpolate_route_distance. 
+    """
+
+    def __init__(self, utm_track, cell_meters=GRID_CELL_METERS):
+        self.cell_meters = cell_meters
+        self.segment_count = max(len(utm_track) - 1, 0)
+        self.cells = { }
+        buffer = MAX_DEVIANCE_METERS
+        for i in range(self.segment_count):
+            east_1, north_1, _ = utm_track[i]
+            east_2, north_2, _ = utm_track[i+1]
+            col_lo = self._cell(min(east_1, east_2) - buffer)
+            col_hi = self._cell(max(east_1, east_2) + buffer)
+            row_lo = self._cell(min(north_1, north_2) - buffer)
+            row_hi = self._cell(max(north_1, north_2) + buffer)
+            for col in range(col_lo, col_hi + 1):
+                for row in range(row_lo, row_hi + 1):
+                    self.cells.setdefault((col, row), [ ]).append(i)
+
+    def _cell(self, coord):
+        return int(math.floor(coord / self.cell_meters))
+
+    def candidates(self, east, north, travel_east=0, travel_north=0):
+        """Indexes of segments that may lie within MAX_DEVIANCE_METERS
+        of (east, north), in path order.  (Direction of travel is not
+        used by the grid.)
+        """
+        return self.cells.get((self._cell(east), self._cell(north)), [ ])
+
+class RouteArrays(object):
+    """A UTM path held as contiguous NumPy columns for the vectorized
+    distance-along-route kernel: eastings, northings and cumulative
+    kilometers per point, and for each segment i (from point i to 
+    point i+1) its unit direction vector and length in meters. 
+    Requires numpy. 
+    """
+
+    def __init__(self, east, north, km, unit_east, unit_north, length):
+        self.east = east
+        self.north = north
+        self.km = km
+        self.unit_east = unit_east
+        self.unit_north = unit_north
+        self.length = length
+
+    @classmethod
+    def from_path(cls, utm_track):
+        """From [(easting, northing, cumdist), ...] as in a _dists.json file"""
+        cols = np.array(utm_track, dtype=np.float64).reshape(-1, 3)
+        east = np.ascontiguousarray(cols[:, 0])
+        north = np.ascontiguousarray(cols[:, 1])
+        km = np.ascontiguousarray(cols[:, 2])
+        d_east = np.diff(east)
+        d_north = np.diff(north)
+        length = np.hypot(d_east, d_north)
+        moving = length > 0
+        unit_east = np.divide(d_east, length,
+                              out=np.zeros_like(d_east), where=moving)
+        unit_north = np.divide(d_north, length,
+                               out=np.zeros_like(d_north), where=moving)
+        return cls(east, north, km, unit_east, unit_north, length)
+
+    def __len__(self):
+        return len(self.east)
+
+def prepare_route(utm_track):
+    """The form of utm_track that interpolate_route_distance measures
+    fastest when called repeatedly on the same route: RouteArrays 
+    if numpy is available, otherwise the path list itself. 
+    """
+    if np is not None and not isinstance(utm_track, RouteArrays):
+        return RouteArrays.from_path(utm_track)
+    return utm_track
+
+def interpolate_route_distance(lat, lon, utm_track, utm_zone, prior_obs=None,
+                                   index=None, hint_km=None):
     """
     If (lat, lon) is within MAX_DEVIANCE_METERS of 
     a segment on utm_track, calculate distance 
@@ -181,15 +406,28 @@ def interpolate_route_distance(lat, lon, utm_track, utm_zone, prior_obs=None):
     If prior is given, it should be a (lat, lon) pair.  In that case, 
     distance returned will be to a track segment within 180 degrees 
     of the same direction (i.e., more "the same way" than "the other way"). 
+
+    If index is given, it should be a SegmentGrid or RouteRaster built
+    from utm_track; only the segments it lists near (lat, lon) are 
+    examined.  The result is the same as without the index. 
+
+    utm_track may be the "path" list of a distances file or, when 
+    numpy is available, a RouteArrays built from it.  With numpy 
+    we measure all candidate segments in a few array operations; 
+    without it we fall back to measuring them one by one. 
+
+    If hint_km is given, it should be the rider's last known distance
+    along the route.  We first search only segments from HINT_BEHIND_KM
+    behind it to HINT_AHEAD_KM ahead of it, and search the whole route
+    only if nothing in that window is within MAX_DEVIANCE_METERS. 
+    Where a route passes the same place twice in the same direction,
+    this picks the pass nearest the rider's progress.  (A SegmentGrid
+    narrows the window; a RouteRaster does not, as the pass near the
+    hint may not be among the few segments it lists.) 
     """
     if len(utm_track) == 0:
         return 0
 
-    skipped_point_count = 0
-    measured_point_count = 0
-    new_min_count = 0
-    buffer = MAX_DEVIANCE_METERS
-    max_dev_sqr = MAX_DEVIANCE_METERS * MAX_DEVIANCE_METERS
     obs_east, obs_north, _, _ = \
          utm.from_latlon(lat, lon, force_zone_number=utm_zone)
 
@@ -203,12 +441,130 @@ def interpolate_route_distance(lat, lon, utm_track, utm_zone, prior_obs=None):
     else:
         travel_east, travel_north = 0, 0
 
+    if np is not None:
+        if not isinstance(utm_track, RouteArrays):
+            utm_track = RouteArrays.from_path(utm_track)
+        kernel = _route_distance_vectorized
+    else:
+        kernel = _route_distance_loop
+
+    segments = None
+    if index is not None:
+        segments = index.candidates(obs_east, obs_north,
+                                    travel_east, travel_north)
+    if hint_km is not None:
+        first, last = _segment_window(utm_track, hint_km - HINT_BEHIND_KM,
+                                      hint_km + HINT_AHEAD_KM)
+        if segments is None or isinstance(index, RouteRaster):
+            # A raster lists only the segments nearest the point,
+            # which may leave out the pass near the rider's progress
+            window = range(first, last)
+        else:
+            window = [seg for seg in segments if first <= seg < last]
+        dist = kernel(obs_east, obs_north, travel_east, travel_north,
+                      bool(prior_obs), utm_track, window)
+        if dist >= 0:
+            return dist
+        log.debug("Nothing near {}km; searching whole route".format(hint_km))
+    return kernel(obs_east, obs_north, travel_east, travel_north,
+                  bool(prior_obs), utm_track, segments)
+
+class _KmColumn(object):
+    """Cumulative distances of a path list, as a sequence for bisect"""
+
+    def __init__(self, utm_track):
+        self.utm_track = utm_track
+
+    def __len__(self):
+        return len(self.utm_track)
+
+    def __getitem__(self, i):
+        return self.utm_track[i][2]
+
+def _segment_window(utm_track, from_km, to_km):
+    """Range (first, last) of segment indexes that overlap 
+    from_km .. to_km along the route. 
+    """
+    if isinstance(utm_track, RouteArrays):
+        km = utm_track.km
+        first = int(np.searchsorted(km, from_km, side="left"))
+        last = int(np.searchsorted(km, to_km, side="right"))
+    else:
+        km = _KmColumn(utm_track)
+        first = bisect.bisect_left(km, from_km)
+        last = bisect.bisect_right(km, to_km)
+    return max(first - 1, 0), min(last, len(utm_track) - 1)
+
+def _route_distance_vectorized(obs_east, obs_north, travel_east, travel_north,
+                               by_direction, route, segments=None):
+    """Distance along route (or -1.0) by measuring every candidate 
+    segment of route (a RouteArrays) at once: all segments, or just 
+    those in segments (a range or list of segment indexes).  The 
+    closest point on each segment is the projection of the observation
+    onto the segment's line, clamped to the segment's extent. 
+    """
+    max_dev_sqr = MAX_DEVIANCE_METERS * MAX_DEVIANCE_METERS
+    if segments is None:
+        segments = range(len(route.length))
+    if isinstance(segments, range):
+        # A slice is a view; no need to gather
+        first = segments.start
+        pick = slice(segments.start, segments.stop)
+    else:
+        first = None
+        pick = np.asarray(segments, dtype=np.intp)
+    if len(segments) == 0:
+        return -1.0
+    east_1 = route.east[pick]
+    north_1 = route.north[pick]
+    unit_east = route.unit_east[pick]
+    unit_north = route.unit_north[pick]
+    length = route.length[pick]
+
+    along = (obs_east - east_1) * unit_east + (obs_north - north_1) * unit_north
+    np.clip(along, 0.0, length, out=along)
+    dev_east = east_1 + along * unit_east - obs_east
+    dev_north = north_1 + along * unit_north - obs_north
+    dev_sqr = dev_east * dev_east + dev_north * dev_north
+    if by_direction:
+        # Negative dot product means "in the contrary direction";
+        # travel of 0,0 accepts every segment
+        dot_product = travel_east * unit_east + travel_north * unit_north
+        dev_sqr[dot_product < 0.0] = np.inf
+
+    best = int(np.argmin(dev_sqr))
+    if not dev_sqr[best] <= max_dev_sqr:
+        return -1.0
+    seg = first + best if first is not None else int(pick[best])
+    if length[best] > 0:
+        frac = along[best] / length[best]
+    else:
+        frac = 1.0
+    from_dist = route.km[seg]
+    to_dist = route.km[seg + 1]
+    return float(from_dist + frac * (to_dist - from_dist))
+
+def _route_distance_loop(obs_east, obs_north, travel_east, travel_north,
+                         by_direction, utm_track, segments=None):
+    """Distance along route (or -1.0), measuring candidate segments of
+    utm_track one at a time: all segments, or just those in segments.
+    Pure Python, for when numpy is missing.
+    """
+    skipped_point_count = 0
+    measured_point_count = 0
+    new_min_count = 0
+    buffer = MAX_DEVIANCE_METERS
+    max_dev_sqr = MAX_DEVIANCE_METERS * MAX_DEVIANCE_METERS
+
+    if segments is None:
+        segments = range(len(utm_track) - 1)
+    skipped_point_count = len(utm_track) - 1 - len(segments)
+
     min_deviance = 2 * max_dev_sqr
     interpolated_dist = 0
-    prior = utm_track[0]
-    for pt in utm_track[1:]:
-        prev = prior
-        prior = pt
+    for i in segments:
+        prev = utm_track[i]
+        pt = utm_track[i+1]
         east_1, north_1, dist_km_1 = prev
         east_2, north_2, dist_km_2 = pt
         # log.debug("Segment ending at distance {:2,.2f}km".format(dist_km_2))
@@ -225,7 +581,7 @@ def interpolate_route_distance(lat, lon, utm_track, utm_zone, prior_obs=None):
         # Second filter: Don't consider track segments running
         # a contrary direction, as indicated by negative dot product.
         # Note 0,0 will result in accepting a point
-        if prior_obs: 
+        if by_direction: 
             dot_product = travel_east * (east_2 - east_1) \
                         + travel_north * (north_2 - north_1)
             # Negative dot product means "in the contrary direction"
@@ -258,7 +614,7 @@ def interpolate_route_distance(lat, lon, utm_track, utm_zone, prior_obs=None):
             elif abs(north_2 - north_1) > 0.1 :
                 frac = (close_north - north_1) / (north_2 - north_1)
             else:
-                fract = 1.0;
+                frac = 1.0
             #log.debug("Interpolating distance at {:2,f} between ".format(frac))
             #log.debug("   between {:2,f}km and {:2,f}km"
             #              .format(from_dist, to_dist))
@@ -352,6 +708,285 @@ def dist_sqr(x1, y1, x2, y2):
 #                                      p2_east, p2_north,
 #                                      px, py))
 
+def douglas_peucker(east, north, tolerance):
+    """Ramer-Douglas-Peucker simplification of the polyline through 
+    projected points (east[i], north[i]):  indexes, in order, of the 
+    vertices to keep so that no dropped vertex is more than tolerance
+    (meters) from the simplified line.  Works down an explicit stack 
+    of spans rather than recursing; with numpy, the deviations of all 
+    vertices in a span are measured in one array operation. 
+    """
+    count = len(east)
+    if count < 3:
+        return list(range(count))
+    if np is not None:
+        east = np.asarray(east, dtype=np.float64)
+        north = np.asarray(north, dtype=np.float64)
+        farthest = _farthest_vectorized
+    else:
+        farthest = _farthest_loop
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    tolerance_sqr = tolerance * tolerance
+    spans = [ (0, count - 1) ]
+    while spans:
+        first, last = spans.pop()
+        if last - first < 2:
+            continue
+        i, dev_sqr = farthest(east, north, first, last)
+        if dev_sqr > tolerance_sqr:
+            keep[i] = True
+            spans.append((i, last))
+            spans.append((first, i))
+    return [ i for i in range(count) if keep[i] ]
+
+def _farthest_vectorized(east, north, first, last):
+    """Index of the vertex strictly between first and last that is
+    farthest from the segment joining them, and its squared distance
+    """
+    seg_east = east[last] - east[first]
+    seg_north = north[last] - north[first]
+    len_sqr = seg_east * seg_east + seg_north * seg_north
+    rel_east = east[first + 1:last] - east[first]
+    rel_north = north[first + 1:last] - north[first]
+    if len_sqr > 0:
+        along = (rel_east * seg_east + rel_north * seg_north) / len_sqr
+        np.clip(along, 0.0, 1.0, out=along)
+        rel_east = rel_east - along * seg_east
+        rel_north = rel_north - along * seg_north
+    dev_sqr = rel_east * rel_east + rel_north * rel_north
+    best = int(np.argmax(dev_sqr))
+    return first + 1 + best, float(dev_sqr[best])
+
+def _farthest_loop(east, north, first, last):
+    """As _farthest_vectorized, one vertex at a time"""
+    best, best_dev_sqr = first + 1, -1.0
+    for i in range(first + 1, last):
+        close_east, close_north = closest_point(east[first], north[first],
+                                                east[last], north[last],
+                                                east[i], north[i])
+        dev_sqr = dist_sqr(east[i], north[i], close_east, close_north)
+        if dev_sqr > best_dev_sqr:
+            best, best_dev_sqr = i, dev_sqr
+    return best, best_dev_sqr
+
+def write_route_binary(binary_file, utm_path, utm_zone):
+    """Write utm_path (as from track_to_utm) in packed binary form
+    to binary_file, a file open for writing bytes.  Requires numpy. 
+    """
+    route = RouteArrays.from_path(utm_path)
+    points = len(route)
+    if points > 0:
+        bbox = (route.east.min(), route.north.min(),
+                route.east.max(), route.north.max())
+    else:
+        bbox = (0.0, 0.0, 0.0, 0.0)
+    binary_file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION,
+                                         utm_zone, points,
+                                         max(points - 1, 0), *bbox))
+    for column in [route.east, route.north, route.km,
+                   route.unit_east, route.unit_north, route.length]:
+        binary_file.write(column.astype("<f8").tobytes())
+
+def read_route_binary(binary_path):
+    """Memory-map a file written by write_route_binary. 
+    Returns (RouteArrays, zone); the arrays are read-only views of 
+    the file, so processes mapping the same route share its pages.
+    """
+    with open(binary_path, "rb") as f:
+        header = f.read(BINARY_HEADER.size)
+    magic, version, zone, points, segments, *bbox = \
+        BINARY_HEADER.unpack(header)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("{} is not a version {} binary route file"
+                         .format(binary_path, BINARY_VERSION))
+    columns = np.memmap(binary_path, dtype="<f8", mode="r",
+                        offset=BINARY_HEADER.size,
+                        shape=(3 * points + 3 * segments,))
+    east, north, km = (columns[i * points:(i + 1) * points]
+                       for i in range(3))
+    base = 3 * points
+    unit_east, unit_north, length = \
+        (columns[base + i * segments:base + (i + 1) * segments]
+         for i in range(3))
+    return RouteArrays(east, north, km, unit_east, unit_north, length), zone
+
+class RouteRaster(object):
+    """Precomputed candidate segments for every cell of a square grid 
+    covering the MAX_DEVIANCE_METERS corridor around a route.  For each
+    cell and each direction-of-travel bin we store the few segments 
+    that could be nearest (among those facing the right way) to any 
+    point in the cell, so interpolate_route_distance need only refine
+    against those.  Looking up a cell costs the same however long the 
+    route is.  Build with build_route_raster (slow; done offline by 
+    prep_routes --raster), and memory-map with read_route_raster. 
+    Requires numpy. 
+    """
+
+    def __init__(self, cell_meters, col_0, row_0, rows, keys, offsets,
+                 segments):
+        self.cell_meters = cell_meters
+        self.col_0 = col_0
+        self.row_0 = row_0
+        self.rows = rows
+        self.keys = keys              # Sorted keys of cells in corridor
+        self.offsets = offsets        # [bin, cell] -> start in segments
+        self.segments = segments      # Candidate segment indexes
+
+    def _key(self, east, north):
+        col = int(math.floor(east / self.cell_meters)) - self.col_0
+        row = int(math.floor(north / self.cell_meters)) - self.row_0
+        if col < 0 or row < 0 or row >= self.rows:
+            return None
+        return col * self.rows + row
+
+    def candidates(self, east, north, travel_east=0, travel_north=0):
+        """Indexes of the segments that may be nearest to (east, north) 
+        for travel in direction (travel_east, travel_north), in path
+        order.  Empty if nothing is within MAX_DEVIANCE_METERS. 
+        """
+        key = self._key(east, north)
+        if key is None:
+            return self.segments[0:0]
+        cell = int(np.searchsorted(self.keys, key))
+        if cell >= len(self.keys) or self.keys[cell] != key:
+            return self.segments[0:0]
+        direction = _direction_bin(travel_east, travel_north)
+        return self.segments[self.offsets[direction, cell]:
+                             self.offsets[direction, cell + 1]]
+
+def _direction_bin(travel_east, travel_north):
+    """Direction-of-travel bin;  RASTER_DIRECTIONS if unknown"""
+    if travel_east == 0 and travel_north == 0:
+        return RASTER_DIRECTIONS
+    angle = math.atan2(travel_north, travel_east) % (2 * math.pi)
+    return min(int(angle / (2 * math.pi / RASTER_DIRECTIONS)),
+               RASTER_DIRECTIONS - 1)
+
+def build_route_raster(route, cell_meters=RASTER_CELL_METERS):
+    """Build a RouteRaster for route (a RouteArrays). 
+
+    A segment is a candidate in a cell (for a direction bin) if it 
+    could be the nearest segment facing that direction from some 
+    point in the cell:  it may face a direction in the bin, and its
+    distance from the cell center is within MAX_DEVIANCE_METERS and 
+    within a cell diagonal of the nearest segment that surely faces 
+    every direction in the bin.  Distances from any point in the cell
+    differ from those from its center by at most half a diagonal, so 
+    the true nearest segment is never left out. 
+    """
+    half_diag = cell_meters * math.sqrt(2) / 2
+    reach = MAX_DEVIANCE_METERS + half_diag
+    east_1, north_1 = route.east[:-1], route.north[:-1]
+    east_2, north_2 = route.east[1:], route.north[1:]
+    col_lo = np.floor((np.minimum(east_1, east_2) - reach) / cell_meters)
+    col_hi = np.floor((np.maximum(east_1, east_2) + reach) / cell_meters)
+    row_lo = np.floor((np.minimum(north_1, north_2) - reach) / cell_meters)
+    row_hi = np.floor((np.maximum(north_1, north_2) + reach) / cell_meters)
+    if len(route.length) == 0:
+        col_0, row_0, rows = 0, 0, 1
+    else:
+        col_0, row_0 = int(col_lo.min()), int(row_lo.min())
+        rows = int(row_hi.max()) - row_0 + 1
+
+    # Every (cell, segment) pair with the cell center within reach
+    pair_keys, pair_segs, pair_dists = [ ], [ ], [ ]
+    for seg in range(len(route.length)):
+        cols = np.arange(col_lo[seg], col_hi[seg] + 1)
+        rows_ = np.arange(row_lo[seg], row_hi[seg] + 1)
+        center_east = np.repeat((cols + 0.5) * cell_meters, len(rows_))
+        center_north = np.tile((rows_ + 0.5) * cell_meters, len(cols))
+        along = ((center_east - east_1[seg]) * route.unit_east[seg] +
+                 (center_north - north_1[seg]) * route.unit_north[seg])
+        along = np.clip(along, 0.0, route.length[seg])
+        dist = np.hypot(east_1[seg] + along * route.unit_east[seg]
+                        - center_east,
+                        north_1[seg] + along * route.unit_north[seg]
+                        - center_north)
+        near = dist <= reach
+        keys = ((np.repeat(cols, len(rows_)) - col_0) * rows +
+                (np.tile(rows_, len(cols)) - row_0))
+        pair_keys.append(keys[near].astype(np.int64))
+        pair_segs.append(np.full(np.count_nonzero(near), seg, dtype=np.int32))
+        pair_dists.append(dist[near])
+    if pair_keys:
+        pair_keys = np.concatenate(pair_keys)
+        pair_segs = np.concatenate(pair_segs)
+        pair_dists = np.concatenate(pair_dists)
+    else:
+        pair_keys = np.zeros(0, dtype=np.int64)
+        pair_segs = np.zeros(0, dtype=np.int32)
+        pair_dists = np.zeros(0)
+    order = np.lexsort((pair_segs, pair_keys))
+    pair_keys, pair_segs, pair_dists = \
+        pair_keys[order], pair_segs[order], pair_dists[order]
+    keys, pair_cells = np.unique(pair_keys, return_inverse=True)
+    pair_cells = pair_cells.reshape(-1)
+
+    # Which bins each segment may face (possible) or surely faces
+    # (definite); a zero-length segment faces every way
+    seg_angle = np.arctan2(route.unit_north, route.unit_east)[pair_segs]
+    still = route.length[pair_segs] == 0
+    bin_width = 2 * math.pi / RASTER_DIRECTIONS
+    slack = 1e-9
+    offsets = np.zeros((RASTER_DIRECTIONS + 1, len(keys) + 1), dtype=np.int32)
+    candidates = [ ]
+    total = 0
+    for direction in range(RASTER_DIRECTIONS + 1):
+        if direction == RASTER_DIRECTIONS:
+            possible = definite = np.ones(len(pair_segs), dtype=bool)
+        else:
+            center = (direction + 0.5) * bin_width
+            off = np.abs((seg_angle - center + math.pi) % (2 * math.pi)
+                         - math.pi)
+            possible = still | (off - bin_width / 2 <= math.pi / 2 + slack)
+            definite = still | (off + bin_width / 2 <= math.pi / 2 - slack)
+        nearest = np.full(len(keys), np.inf)
+        np.minimum.at(nearest, pair_cells[definite], pair_dists[definite])
+        keep = possible & (pair_dists <= np.minimum(
+            nearest[pair_cells] + 2 * half_diag, reach))
+        counts = np.bincount(pair_cells[keep], minlength=len(keys))
+        offsets[direction, 1:] = np.cumsum(counts)
+        offsets[direction] += total
+        total += int(counts.sum())
+        candidates.append(pair_segs[keep])
+    segments = np.concatenate(candidates).astype(np.int32)
+    return RouteRaster(cell_meters, col_0, row_0, rows,
+                       keys, offsets, segments)
+
+def write_route_raster(raster_file, raster):
+    """Write a RouteRaster to raster_file, open for writing bytes"""
+    raster_file.write(RASTER_HEADER.pack(
+        RASTER_MAGIC, RASTER_VERSION, RASTER_DIRECTIONS,
+        raster.cell_meters, raster.col_0, raster.row_0, raster.rows,
+        len(raster.keys), len(raster.segments)))
+    raster_file.write(np.asarray(raster.keys, dtype="<i8").tobytes())
+    raster_file.write(np.asarray(raster.offsets, dtype="<i4").tobytes())
+    raster_file.write(np.asarray(raster.segments, dtype="<i4").tobytes())
+
+def read_route_raster(raster_path):
+    """Memory-map a RouteRaster written by write_route_raster"""
+    with open(raster_path, "rb") as f:
+        header = f.read(RASTER_HEADER.size)
+    (magic, version, directions, cell_meters, col_0, row_0, rows,
+     cells, segment_count) = RASTER_HEADER.unpack(header)
+    if (magic != RASTER_MAGIC or version != RASTER_VERSION
+            or directions != RASTER_DIRECTIONS):
+        raise ValueError("{} is not a version {} route raster with {} "
+                         "directions".format(raster_path, RASTER_VERSION,
+                                             RASTER_DIRECTIONS))
+    offset = RASTER_HEADER.size
+    keys = np.memmap(raster_path, dtype="<i8", mode="r",
+                     offset=offset, shape=(cells,))
+    offset += 8 * cells
+    offsets = np.memmap(raster_path, dtype="<i4", mode="r", offset=offset,
+                        shape=(directions + 1, cells + 1))
+    offset += 4 * (directions + 1) * (cells + 1)
+    segments = np.memmap(raster_path, dtype="<i4", mode="r",
+                         offset=offset, shape=(segment_count,))
+    return RouteRaster(cell_meters, col_0, row_0, rows,
+                       keys, offsets, segments)
+
 def cli_args():
     """
     When invoked from the command line, we create 
@@ -366,6 +1001,12 @@ def cli_args():
     parser.add_argument('utm_file_out',
                             help="Output file is json of utm with distance",
                             type=argparse.FileType('w'))
+    parser.add_argument('--binary', dest="binary_file_out",
+                            help="Also write the packed binary form",
+                            type=argparse.FileType('wb'))
+    parser.add_argument('--raster', dest="raster_file_out",
+                            help="Also precompute a route raster",
+                            type=argparse.FileType('wb'))
     args = parser.parse_args();
     return args
 
@@ -376,5 +1017,10 @@ if __name__ == "__main__":
     points = json.load(infile)
     utm_path, zone = track_to_utm(points)
     json.dump({ "zone": zone, "path": utm_path }, outfile)
+    if args.binary_file_out:
+        write_route_binary(args.binary_file_out, utm_path, zone)
+    if args.raster_file_out:
+        raster = build_route_raster(RouteArrays.from_path(utm_path))
+        write_route_raster(args.raster_file_out, raster)
 
 
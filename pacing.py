@@ -0,0 +1,39 @@
+"""
+Pacing of requests to upstream services that limit our rate.
+
+A SharedPacer is shared by every thread of a process, and through a
+lease (storage.py) that lasts one interval between requests, by
+every process and host using the same database.  So requests made
+concurrently (e.g., by spot.fetch_feeds, in each web worker and the
+poller) are still spaced out as the service asks.
+"""
+
+import threading
+import time
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+
+class SharedPacer(object):
+    """At most rate take()s per second among every process sharing
+    leases: each take() waits to acquire the lease called key for
+    1/rate seconds, and lets it expire rather than releasing it.
+    Thread safe.
+    """
+
+    def __init__(self, leases, key, rate):
+        self.leases = leases
+        self.key = key
+        self.rate = rate
+        self._lock = threading.Lock()   # One thread per process polls
+
+    def take(self):
+        """Wait until no process has taken within 1/rate seconds"""
+        interval = 1 / self.rate
+        with self._lock:
+            while self.leases.acquire(self.key, interval) is None:
+                # Until the lease another process took expires
+                time.sleep(self.leases.remaining(self.key))
@@ -0,0 +1,105 @@
+#! /usr/bin/env python3
+#
+"""
+Background poller for tracker feeds (a worker process).
+
+Refreshes every Spot feed of the riders in events/*.csv (or just the
+events named in configuration poll_events) into the Mongo cache on a
+schedule, measuring their progress along their routes as it goes, so
+that the web tier need not query Spot while a browser waits.  With
+--trackleaders it also keeps the TrackLeaders feed fresh.
+
+With background_polling set to true, the web tier queries Spot
+itself only for a feed that is more than poll_fallback_minutes old,
+i.e., one the poller is not covering.
+
+usage: python3 poller.py [--once] [--trackleaders]
+"""
+
+import os
+import glob
+import time
+import argparse
+
+import config
+import event_reader
+import progress
+import spot
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+# Configurable ...
+POLL_INTERVAL_SECONDS = float(config.get("poll_interval_seconds"))
+POLL_EVENTS = config.get("poll_events")
+
+EVENTS_DIR = "events"
+
+
+def getargs():
+    """Return arguments as a NameSpace object"""
+    parser = argparse.ArgumentParser("Poll tracker feeds into the cache")
+    parser.add_argument("--once", action="store_true",
+                        help="Poll once and exit")
+    parser.add_argument("--trackleaders", action="store_true",
+                        help="Also poll the TrackLeaders feed")
+    return parser.parse_args()
+
+def event_names():
+    """Names of the events to poll: those in poll_events if set,
+    else every events/*.csv
+    """
+    if POLL_EVENTS:
+        return [ name.strip() for name in POLL_EVENTS.split(",")
+                 if name.strip() ]
+    paths = glob.glob(os.path.join(EVENTS_DIR, "*.csv"))
+    return sorted(os.path.basename(path)[:-len(".csv")] for path in paths)
+
+def active_routes(names):
+    """Map from tracker id to route abbreviation, for the riders of
+    all the events named (read afresh, so edits take effect).  A 
+    tracker in several events is measured on the route of the last; 
+    the web tier measures others when asked. 
+    """
+    routes = { }
+    for name in names:
+        event_record = event_reader.EventRecord(name)
+        if not event_record.loaded:
+            log.warning("Skipping event {}: {}"
+                        .format(name, event_record.errmsg))
+            continue
+        routes.update(progress.event_routes(event_record))
+    return routes
+
+def poll_once(trackleaders=None):
+    """Refresh every stale feed of the active events.  trackleaders
+    is the trackleaders module if we poll it too.
+    """
+    routes = active_routes(event_names())
+    log.info("Polling {} Spot feeds".format(len(routes)))
+    spot.get_feeds(list(routes), routes)
+    if trackleaders is not None:
+        trackleaders.cache_reload_if_stale(routes)
+
+def main():
+    args = getargs()
+    trackleaders = None
+    if args.trackleaders:
+        # Only configured for events that use TrackLeaders
+        import trackleaders
+    while True:
+        started = time.monotonic()
+        try:
+            poll_once(trackleaders)
+        except Exception as e:
+            # Keep polling; the next round may go better
+            log.exception("Polling failed: {}".format(e))
+        if args.once:
+            break
+        elapsed = time.monotonic() - started
+        time.sleep(max(0.0, POLL_INTERVAL_SECONDS - elapsed))
+
+if __name__ == "__main__":
+    main()
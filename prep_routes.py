@@ -0,0 +1,178 @@
+#! /usr/bin/env python3
+#
+"""
+Prepare many routes at once (command line tool). 
+
+Simplifies and measures every GPX file in a directory or listed in
+a manifest (or a single GPX file, as the 'prep' script does), in a 
+pool of worker processes.  Routes are measured on the full track 
+before simplifying, so the reported distance is not shortened. 
+
+For each route with prefix P we write static/routes/P_points.json, 
+P_dists.json, and (with numpy) P_dists.bin; with --raster, also the
+route raster P_raster.bin for the fastest distance lookups.  A route
+is skipped if its GPX file and options are unchanged since it was 
+last prepared, as recorded in prep_hashes.json (--hashes; kept out
+of static/, which is served to anyone). 
+
+A GPX file given directly is prepared with prefix from --prefix, 
+or else its file name without '.gpx'.  A manifest is a text file 
+with one route per line:
+    path/to/route.gpx  [prefix]
+Prefix defaults to the GPX file name without '.gpx'.  Blank lines 
+and lines starting with '#' are ignored. 
+
+usage: python3 prep_routes.py --delta 30 gpx_directory_or_manifest ...
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import gpx_simplify
+import measure
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+ROUTES_DIR = os.path.join("static", "routes")
+HASHES_PATH = "prep_hashes.json"
+
+
+def getargs(argv=None):
+    """Return arguments as a NameSpace object"""
+    parser = argparse.ArgumentParser("Prepare routes from GPX files")
+    parser.add_argument("sources", nargs="+",
+                        help="Directories of .gpx files, .gpx files,"
+                        + " or manifest files")
+    parser.add_argument("--prefix", dest="prefix", default=None,
+                        help="Prefix for route files of a single .gpx file")
+    parser.add_argument("--delta", dest="delta", type=int, default=30,
+                        help="Max deviation from input route, in meters")
+    parser.add_argument("--out", dest="out_dir", default=ROUTES_DIR,
+                        help="Directory for prepared route files")
+    parser.add_argument("--workers", dest="workers", type=int, default=None,
+                        help="Worker processes (default one per CPU)")
+    parser.add_argument("--hashes", dest="hashes_path", default=HASHES_PATH,
+                        help="Record of routes prepared (not under static/)")
+    parser.add_argument("--force", action="store_true",
+                        help="Prepare routes even if unchanged")
+    parser.add_argument("--raster", action="store_true",
+                        help="Also precompute route rasters (needs numpy)")
+    return parser.parse_args(argv)
+
+def route_sources(sources, prefix=None):
+    """List of (gpx path, prefix) from directories, GPX files, and
+    manifests.  prefix, if given, names the route of a GPX file. 
+    """
+    routes = [ ]
+    for source in sources:
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.lower().endswith(".gpx"):
+                    routes.append((os.path.join(source, name), name[:-4]))
+            continue
+        if source.lower().endswith(".gpx"):
+            routes.append((source,
+                           prefix or os.path.basename(source)[:-4]))
+            continue
+        base = os.path.dirname(source)
+        with open(source) as manifest:
+            for line in manifest:
+                fields = line.split()
+                if len(fields) == 0 or fields[0].startswith("#"):
+                    continue
+                gpx_path = os.path.join(base, fields[0])
+                if len(fields) > 1:
+                    route_prefix = fields[1]
+                else:
+                    route_prefix = os.path.basename(gpx_path)[:-4]
+                routes.append((gpx_path, route_prefix))
+    return routes
+
+def source_hash(gpx_path, delta, raster=False):
+    """Hash of the GPX file contents and preparation options"""
+    digest = hashlib.sha256()
+    with open(gpx_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    digest.update("delta={}".format(delta).encode("utf-8"))
+    if raster:
+        digest.update(b"raster")
+    return digest.hexdigest()
+
+def prep_route(gpx_path, prefix, out_dir, delta, raster=False):
+    """Simplify and measure one route; runs in a worker process. 
+    Returns (prefix, number of points). 
+    """
+    points, utm_path, zone = gpx_simplify.simplified_route(gpx_path, delta)
+    out_base = os.path.join(out_dir, prefix)
+    with open(out_base + "_points.json", "w", encoding="utf-8") as f:
+        print(json.dumps(points), file=f)
+    with open(out_base + "_dists.json", "w") as f:
+        json.dump({ "zone": zone, "path": utm_path }, f)
+    if measure.np is not None:
+        with open(out_base + "_dists.bin", "wb") as f:
+            measure.write_route_binary(f, utm_path, zone)
+        if raster:
+            with open(out_base + "_raster.bin", "wb") as f:
+                measure.write_route_raster(f, measure.build_route_raster(
+                    measure.RouteArrays.from_path(utm_path)))
+    return prefix, len(points)
+
+def main(argv=None):
+    args = getargs(argv)
+    hashes_path = args.hashes_path
+    try:
+        with open(hashes_path) as f:
+            hashes = json.load(f)
+    except FileNotFoundError:
+        hashes = { }
+
+    jobs = { }
+    failures = 0
+    sources = { }
+    for gpx_path, prefix in route_sources(args.sources, args.prefix):
+        if prefix in sources:
+            # Both would write the same route files
+            failures += 1
+            log.error("{} and {} both have prefix {}; skipping {}".format(
+                sources[prefix], gpx_path, prefix, gpx_path))
+            continue
+        sources[prefix] = gpx_path
+        digest = source_hash(gpx_path, args.delta, args.raster)
+        out_base = os.path.join(args.out_dir, prefix)
+        if (not args.force and hashes.get(out_base) == digest
+                and os.path.exists(out_base + "_dists.json")):
+            log.info("{} unchanged; skipping".format(prefix))
+            continue
+        jobs[prefix] = (gpx_path, digest)
+    log.info("Preparing {} routes".format(len(jobs)))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = { pool.submit(prep_route, gpx_path, prefix,
+                                args.out_dir, args.delta,
+                                args.raster): prefix
+                    for prefix, (gpx_path, _) in jobs.items() }
+        for future in as_completed(futures):
+            prefix = futures[future]
+            try:
+                _, point_count = future.result()
+                hashes[os.path.join(args.out_dir, prefix)] = jobs[prefix][1]
+                log.info("Prepared {} ({} points)".format(prefix, point_count))
+            except Exception as e:
+                failures += 1
+                log.error("Failed to prepare {}: {}".format(prefix, e))
+
+    with open(hashes_path, "w") as f:
+        json.dump(hashes, f, indent=1, sort_keys=True)
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
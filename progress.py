@@ -0,0 +1,85 @@
+"""
+Distance along route of tracker observations, measured on the
+server.
+
+When spot.py or trackleaders.py refresh a feed, they measure the
+new latest observation once along the rider's route (from the event
+CSV) and keep the result in the track record, in
+    latest["route_km"][route abbreviation]
+next to latest["prior_position"], so that /_riders can report
+progress without each browser asking for it.
+"""
+
+import os
+
+import route_cache
+import along_memo
+import measure
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+ROUTES_DIR = os.path.join("static", "routes")
+
+
+def along_distance(route, lat, lon, prior=None, hint_km=None):
+    """Distance along route (a route_cache.Route) of an observation
+    at (lat, lon), filtered by direction if the prior (lat, lon) is
+    known, and searching near hint_km first if given.  Recent results
+    are remembered, as many spectators ask about the same rider at
+    the same fix.
+    """
+    return along_memo.get(route, lat, lon, prior, hint_km,
+        lambda: measure.interpolate_route_distance(lat, lon, route.prepared,
+                                                   route.zone, prior,
+                                                   index=route.index,
+                                                   hint_km=hint_km))
+
+def distances_path(abbrev):
+    """The distances file of the route with abbreviation abbrev"""
+    return os.path.join(ROUTES_DIR, "{}_dists.json".format(abbrev))
+
+def add_progress(latest, abbrev, previous=None):
+    """Measure latest (the "latest" observation of a track record)
+    along route abbrev, recording it in latest["route_km"].  previous
+    is the "latest" observation that this one replaces, if any; its
+    distance along the same route is reused if the observation is
+    unchanged, and otherwise is where we search first.  Returns the
+    distance, or None if there are no distances for that route.
+    """
+    if "." in abbrev or abbrev.startswith("$"):
+        # Not usable as a MongoDB field name
+        log.warning("Can't record distances on route {}".format(abbrev))
+        return None
+    route_km = latest.setdefault("route_km", { })
+    prior_km = None
+    if previous:
+        prior_km = previous.get("route_km", { }).get(abbrev)
+        if (prior_km is not None
+                and previous.get("dateTime") == latest.get("dateTime")
+                and previous.get("latlon") == latest.get("latlon")):
+            route_km[abbrev] = prior_km
+            return prior_km
+    try:
+        route = route_cache.distances(distances_path(abbrev))
+    except FileNotFoundError:
+        log.warning("No distances for route {}".format(abbrev))
+        return None
+    lat, lon = latest["latlon"]
+    prior = latest.get("prior_position")
+    if prior:
+        prior = tuple(prior)
+    if prior_km is not None and prior_km < 0:
+        prior_km = None
+    km = along_distance(route, lat, lon, prior, prior_km)
+    route_km[abbrev] = km
+    return km
+
+def event_routes(event_record):
+    """Map from tracker id to route abbreviation, for the riders of
+    an event_reader.EventRecord
+    """
+    return { rider.spot: rider.route.strip()
+             for rider in event_record.riders }
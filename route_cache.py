@@ -0,0 +1,207 @@
+"""
+Route files (static/routes/*_points.json and *_dists.json), parsed
+once and kept in memory for the life of the server process. 
+
+A route prepared by 'prep' with a packed _dists.bin beside its 
+_dists.json is memory-mapped rather than parsed, and so is the
+_raster.bin route raster (see measure.RouteRaster) if 'prep_routes 
+--raster' made one.  Entries are keyed by file path and reloaded if
+the file's modification time changes, so re-running 'prep' on a
+route takes effect without a restart.  The cache holds at most
+ROUTE_CACHE_SIZE routes, evicting the least recently used.  Hit,
+miss, eviction and invalidation (reload) counts are available from
+stats().
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+import config
+import measure
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+# Configurable ...
+ROUTE_CACHE_SIZE = int(config.get("route_cache_size"))
+
+
+class Route(object):
+    """A distances file, prepared for measurement: the UTM zone, the 
+    path in the form interpolate_route_distance measures fastest, and
+    an index over it: the route raster if there is one, else (for 
+    routes loaded from JSON) a SegmentGrid. 
+    """
+
+    def __init__(self, zone, prepared, index=None):
+        self.zone = zone
+        self.prepared = prepared
+        self.index = index
+
+
+class RoutePoints(object):
+    """A points file: the list of [lat, lon], its JSON text, and for
+    conditional requests, an ETag of the text and the file's
+    modification time (seconds since the epoch)
+    """
+
+    def __init__(self, text, mtime=None):
+        self.text = text
+        self.points = json.loads(text)
+        if not isinstance(self.points, list):
+            raise ValueError("Expecting an array of points")
+        self.etag = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        self.mtime = mtime
+
+
+class LRU(object):
+    """Least-recently-used map of at most max_entries entries, with
+    counts of hits, misses, evictions, and invalidations (entries
+    found but no longer fresh).  Thread safe. 
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key, fresh=None):
+        """The entry for key, or None if there is none, or (if fresh
+        is given) fresh(entry) is false; then the entry is dropped. 
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if fresh is None or fresh(entry):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                del self._entries[key]
+                self.invalidations += 1
+            self.misses += 1
+            return None
+
+    def store(self, key, entry):
+        """Keep entry for key, evicting the least recently used if full"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return { "entries": len(self._entries),
+                     "max_entries": self.max_entries,
+                     "hits": self.hits,
+                     "misses": self.misses,
+                     "evictions": self.evictions,
+                     "invalidations": self.invalidations }
+
+
+class RouteCache(LRU):
+    """Least-recently-used cache of loaded files, keyed by path and
+    invalidated by modification time.  Entries are (mtime, value). 
+    """
+
+    def get(self, path, loader):
+        """The value of loader(path), from cache if the file is 
+        unchanged since we last loaded it.  Raises FileNotFoundError
+        if there is no such file. 
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self.discard(path)
+            raise
+        entry = self.lookup(path, lambda entry: entry[0] == mtime)
+        if entry is not None:
+            return entry[1]
+        log.debug("Loading {} into route cache".format(path))
+        value = loader(path)
+        self.store(path, (mtime, value))
+        return value
+
+
+def _load_distances(dists_path):
+    with open(dists_path) as f:
+        track_obj = json.load(f)
+    assert type(track_obj) == dict, "Distances file must be dict"
+    assert "path" in track_obj and "zone" in track_obj, \
+         "Distances file must be object with UTM path and zone"
+    path = track_obj["path"]
+    index = _load_raster(dists_path)
+    if index is None:
+        index = measure.SegmentGrid(path)
+    return Route(track_obj["zone"], measure.prepare_route(path), index)
+
+def _load_binary(path):
+    # Memory-mapped columns are cheap to scan in full, and building a
+    # SegmentGrid would cost as much as parsing the JSON we avoided
+    prepared, zone = measure.read_route_binary(path)
+    return Route(zone, prepared, _load_raster(path))
+
+def _load_raster(dists_path):
+    """The route raster beside a _dists file, or None"""
+    base, _ = os.path.splitext(dists_path)
+    if measure.np is None or not base.endswith("_dists"):
+        return None
+    raster_path = base[:-len("_dists")] + "_raster.bin"
+    if not _up_to_date(raster_path, base + ".json"):
+        return None
+    return measure.read_route_raster(raster_path)
+
+def _up_to_date(derived_path, source_path):
+    """Does derived_path exist, and is it no older than source_path
+    (if that exists)?  A file made from the source by an earlier
+    'prep' must not shadow the source made by a later one. 
+    """
+    try:
+        derived_mtime = os.stat(derived_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    try:
+        return derived_mtime >= os.stat(source_path).st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+def _load_points(path):
+    with open(path) as f:
+        return RoutePoints(f.read(), os.fstat(f.fileno()).st_mtime)
+
+
+# Performed once at instantiation; shared by all requests
+# in this process
+routes = RouteCache(ROUTE_CACHE_SIZE)
+
+def distances(path):
+    """The Route for a _dists.json file, memory-mapped from the 
+    _dists.bin file beside it if there is one no older than the 
+    JSON (and numpy to read it). 
+    """
+    if measure.np is not None and path.endswith(".json"):
+        binary_path = path[:-len(".json")] + ".bin"
+        if _up_to_date(binary_path, path):
+            return routes.get(binary_path, _load_binary)
+    return routes.get(path, _load_distances)
+
+def points(path):
+    """The RoutePoints for a _points.json file"""
+    return routes.get(path, _load_points)
+
+def stats():
+    return routes.stats()
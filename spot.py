@@ -1,6 +1,6 @@
 """
 The enroute functionality tied to spot trackers, 
-including caching in a MongoDB database. 
+including caching in a database (see storage.py). 
 
 A spot feed normally looks like this:
 
@@ -71,11 +71,15 @@ import sys
 import os
 import json
 import arrow
-import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 # import urllib.request  # Obsolete
-import requests          # Currently version 2.8; 3 out soon
 import config
-from pymongo import MongoClient
+import upstream
+import progress
+import pacing
+import storage
+import coalesce
 
 import logging
 logging.basicConfig(format='%(levelname)s:%(message)s',
@@ -83,30 +87,49 @@ logging.basicConfig(format='%(levelname)s:%(message)s',
 log = logging.getLogger(__name__)
 
 # Configurable ... 
-MONGO_URL=config.get("mongo_url")
 QUERY_INTERVAL_MINUTES = int(config.get("query_interval_minutes"))
+# Spot asks for a pause between requests; we keep that pace across
+# all the feeds we query at once, in every worker sharing the database
+SPOT_REQUESTS_PER_SECOND = float(config.get("spot_requests_per_second"))
+SPOT_FETCH_WORKERS = int(config.get("spot_fetch_workers"))
+# Longest a worker may take to refresh a feed before another may
+REFRESH_LEASE_SECONDS = float(config.get("refresh_lease_seconds"))
 
 URL_API = "https://api.findmespot.com/spot-main-web/consumer/rest-api/2.0/public/feed/{}/message.json"
+# Spot returns at most this many messages per request, newest first;
+# for more, we ask again from the next 'start'
+SPOT_PAGE_SIZE = 50
+SPOT_MAX_PAGES = 10
+# Recent points, for the path we draw
+PATH_HOURS = 1
 
 # A time before time, and before spot trackers
 EPOCH = arrow.get(0)
 
-client = MongoClient(MONGO_URL)
-db = client.enroute
-collection = db.tracks
+# Track records by feed id
+tracks = storage.table("tracks", "id")
+# Every message we have received from each feed
+history = storage.log_table("spot_messages", "feed", "unixTime", "id")
+# One refresh of a feed at a time: in this process, and (by lease)
+# in every worker sharing the database
+in_flight = coalesce.SingleFlight()
+refresh_leases = storage.leases("leases")
+
+spot_pacing = pacing.SharedPacer(refresh_leases, "spot:pacing",
+                                 SPOT_REQUESTS_PER_SECOND)
 
 class BadSpotFeed(Exception):
     """That Spot GID didn't work"""
     pass
 
-def is_stale(a):
+def is_stale(a, minutes=QUERY_INTERVAL_MINUTES):
     """a is an arrow object.  It is stale if it is more than 
-    QUERY_INTERVAL_MINUTES in the past. 
+    minutes (default QUERY_INTERVAL_MINUTES) in the past. 
     """
     now = arrow.now()
-    return now > a.replace(minutes=QUERY_INTERVAL_MINUTES)
+    return now > a.replace(minutes=minutes)
 
-def get_feeds(feedlist):
+def get_feeds(feedlist, routes=None, stale_minutes=QUERY_INTERVAL_MINUTES):
     """Retrieve spot information, from cache or directly
     from Spot depending on whether they are stale.
     Output will look like 
@@ -114,13 +137,28 @@ def get_feeds(feedlist):
            latest: { spot observation data }, 
            path: [ points in last hour ] }, 
           ... ]
+    If routes maps a spot id to the abbreviation of its rider's 
+    route, the latest observation is measured along that route 
+    (see progress.py) when it is first seen.  Feeds are queried
+    again when more than stale_minutes old (longer when the poller
+    keeps them fresh), unless another worker is querying them; 
+    then we read what it has cached.  We write only the records we
+    refresh (each as we refresh it, under its lease) and the
+    distances we measure (as just those fields), so as not to
+    overwrite a record another worker has refreshed since we read it. 
     """
+    if routes is None:
+        routes = { }
     feeds = [ ]  
     log.debug("-> get_feeds({})".format(feedlist))
+    # One read for all the records, and one write of distances
+    records = tracks.get_many(set(feedlist))
+    measured = { }
+    stale = [ ]
     for feed in feedlist:
-        request = { "id": feed }
-        record = collection.find_one(request)
-        if (record == None):
+        if feed in records:
+            record = records[feed]
+        else:
             log.debug("No record for {}".format(feed))
             record = { "id": feed,
                         "last_query_time":
@@ -128,63 +166,182 @@ def get_feeds(feedlist):
                         "latest": { }, 
                         "path": [ ]
                       }
-            collection.insert(record)
+            records[feed] = record
         last_queried = arrow.get(record["last_query_time"])
         # Note that a bogus "missing" record is always stale,
-        # but here we'll update its last query time even if there
+        # but its refresh stores the last query time even if there
         # are no records available from Spot. This is to ensure
         # we poll it at the same rate as Spots with data, not faster. 
-        if is_stale(last_queried):
-            try:
-                record = spot_direct_query(feed)
-                collection.update_one(  {"id": feed },
-                                        {"$set": record }  )
-                if "_id" in record:
-                    del record["_id"]  # Because it isn't JSON serializable
-            except BadSpotFeed as e:
-                log.warn(f"Bad spot feed: {feed}")
+        if is_stale(last_queried, stale_minutes) and feed not in stale:
+            stale.append(feed)
+
+    # Stale feeds are queried together
+    previous = { feed: records[feed] for feed in stale }
+    skipped = [ ]
+    for feed, record in fetch_feeds(stale, routes, previous, stale_minutes):
+        if record is None:
+            skipped.append(feed)
+        else:
+            records[feed] = record
+    if skipped:
+        # Refreshed by someone else, perhaps since we read them
+        records.update(tracks.get_many(skipped))
 
-        if "_id" in record:
-            del record["_id"]  # Because it isn't JSON serializable
+    for feed in feedlist:
+        record = records[feed]
+        route = routes.get(feed)
+        latest = record.get("latest")
+        if (route and latest and
+                route not in latest.get("route_km", { })):
+            # Refreshed without knowing this rider's route
+            km = progress.add_progress(latest, route)
+            if km is not None:
+                measured[feed] = { "latest.route_km.{}".format(route): km }
         if "latest" in record and record["latest"] != {}:
             feeds.append(record)
 
-
+    if measured:
+        tracks.update_fields_many(measured)
     return feeds
 
-def spot_direct_query(feed):
+def fetch_feeds(feeds, routes=None, previous=None,
+                stale_minutes=QUERY_INTERVAL_MINUTES):
+    """Query Spot for each of feeds (a list of ids) concurrently, as
+    fast as spot_pacing allows.  Yields (feed, record) as each query
+    completes, record as from spot_direct_query (with the feed's 
+    route from routes and previous track record from previous),
+    or None if Spot rejected the feed, the query failed, or we left
+    it to another worker (see refresh_feed). 
+    """
+    if routes is None:
+        routes = { }
+    if previous is None:
+        previous = { }
+    if not feeds:
+        return
+    with ThreadPoolExecutor(max_workers=SPOT_FETCH_WORKERS) as pool:
+        futures = { pool.submit(refresh_feed, feed, routes.get(feed),
+                                previous.get(feed), stale_minutes): feed
+                    for feed in feeds }
+        for future in as_completed(futures):
+            feed = futures[future]
+            try:
+                record = future.result()
+            except BadSpotFeed as e:
+                log.warn(f"Bad spot feed: {feed}")
+                record = None
+            except (requests.RequestException, ValueError) as e:
+                # Timed out, unreachable, or not JSON; the other
+                # feeds of the batch are still good
+                log.warning(f"Spot query of {feed} failed: {e}")
+                record = None
+            yield feed, record
+
+def refresh_feed(feed, route=None, previous=None,
+                 stale_minutes=QUERY_INTERVAL_MINUTES):
+    """spot_direct_query(feed, route, previous), merged into the
+    record we had (so fields the query did not set are kept) and
+    stored; or if another thread of this process is already 
+    querying feed, its result.  Returns None if another worker
+    holds the lease on feed, or refreshed it (to less than 
+    stale_minutes old) since previous was read.
+    """
+    return in_flight.do(feed, _refresh_leased, feed, route, previous,
+                        stale_minutes)
+
+def _refresh_leased(feed, route, previous, stale_minutes):
+    key = "spot:{}".format(feed)
+    token = refresh_leases.acquire(key, REFRESH_LEASE_SECONDS)
+    if token is None:
+        log.debug("Feed {} is being refreshed elsewhere".format(feed))
+        return None
+    try:
+        current = tracks.get(feed)
+        if (current is not None and not
+                is_stale(arrow.get(current["last_query_time"]), stale_minutes)):
+            log.debug("Feed {} was refreshed elsewhere".format(feed))
+            return None
+        previous = current or previous or { }
+        record = dict(previous, **spot_direct_query(feed, route, previous))
+        # Stored while we hold the lease, so no other worker can be
+        # storing an older refresh
+        tracks.put(feed, record)
+        return record
+    finally:
+        refresh_leases.release(key, token)
+
+def spot_direct_query(feed, route=None, previous=None):
     """Returns record with fields id, last_query_time,
-    last_observation, path 
+    latest, path, newest_unix_time and newest_message_id.  previous
+    is the track record we had before, if any; we ask Spot only for
+    messages newer than its newest_unix_time, and add them to the 
+    message history.  If route (an abbreviation) is given, the 
+    latest observation is measured along it. 
     """
-    time.sleep(2)
-    messages = spot_feed(feed)
+    if previous is None:
+        previous = { }
+    now = arrow.now()
+    since = previous.get("newest_unix_time")
+    messages = spot_feed(feed, since=since)
     log.debug("Spot observation: {}".format(messages))
-    if len(messages) == 0:
-        return { "id": feed, "last_query_time": arrow.now().isoformat(),
-                 "last_observation": EPOCH.isoformat(), "path": [ ] }
-    # So we have at least one observation.
-    log.debug("At least one message, handling last")
-    last = messages[0]
-    last_obs = { "dateTime": last["dateTime"],
-                 "latlon":   [ last["latitude"], last["longitude"] ],
-                 "batteryState":  last["batteryState"] }
-    # Previous point observed is useful for determining
-    # direction of travel. We get this even if the user has
-    # been paused for longer than their track expiration.
-    # Messages are in backward chronological order (per example),
-    # so messages[1] is the penultimate position
-    if len(messages) > 1:
-        last_obs["prior_position"] = [ messages[1]["latitude"],
-                                       messages[1]["longitude"]]
-    path = [ ]
-    points_expire = arrow.now().replace(hours=-1)
-    #points_expire = arrow.now().replace(days=-7)
-    for point in messages: 
-        if arrow.get(point["dateTime"]) < points_expire:
-            break
-        path.append([ point["latitude"], point["longitude"] ])
-    return { "id": feed, "last_query_time": arrow.now().isoformat(),
-                 "latest": last_obs, "path": path }
+    record = { "id": feed, "last_query_time": now.isoformat() }
+    if len(messages) > 0:
+        save_history(feed, messages)
+        record["newest_unix_time"] = int(messages[0]["unixTime"])
+        record["newest_message_id"] = messages[0]["id"]
+    last_obs = previous.get("latest") or { }
+    if len(messages) > 0:
+        log.debug("At least one message, handling last")
+        last = messages[0]
+        prior_obs = last_obs
+        last_obs = { "dateTime": last["dateTime"],
+                     "latlon":   [ last["latitude"], last["longitude"] ],
+                     "batteryState":  last["batteryState"] }
+        # Previous point observed is useful for determining
+        # direction of travel. We get this even if the user has
+        # been paused for longer than their track expiration.
+        # Messages are in backward chronological order (per example),
+        # so messages[1] is the penultimate position, or else it's
+        # the one we had before
+        if len(messages) > 1:
+            last_obs["prior_position"] = [ messages[1]["latitude"],
+                                           messages[1]["longitude"]]
+        elif "latlon" in prior_obs:
+            last_obs["prior_position"] = prior_obs["latlon"]
+    if not last_obs:
+        record.update({ "last_observation": EPOCH.isoformat(),
+                        "path": [ ] })
+        return record
+    if route:
+        progress.add_progress(last_obs, route, previous.get("latest"))
+    record["latest"] = last_obs
+    points_expire = now.replace(hours=-PATH_HOURS)
+    record["path"] = [ msg["latlon"] for msg in 
+                       feed_history(feed, points_expire.timestamp, newest=True) ]
+    return record
+
+def save_history(feed, messages):
+    """Add Spot messages of feed to its history (if not there already)"""
+    entries = [ ]
+    for msg in messages:
+        entry = { "feed": feed,
+                  "id": msg["id"],
+                  "unixTime": int(msg["unixTime"]),
+                  "dateTime": msg["dateTime"],
+                  "messageType": msg.get("messageType"),
+                  "latlon": [ msg["latitude"], msg["longitude"] ],
+                  "batteryState": msg.get("batteryState") }
+        if "messageContent" in msg:
+            entry["messageContent"] = msg["messageContent"]
+        entries.append(entry)
+    history.append(feed, entries)
+
+def feed_history(feed, since=0, newest=False):
+    """Messages of feed from unix time since onward, from the message
+    history: oldest first, or newest first if newest is True.  Each 
+    has id, unixTime, dateTime, messageType, latlon and batteryState.
+    """
+    return history.since(feed, since, newest)
 
 def spot_gid_valid(feed_id):
     """
@@ -198,26 +355,49 @@ def spot_gid_valid(feed_id):
         err_message = "{}".format(e)
         return False, err_message
         
-def spot_feed(feed_id,empty_exception=False):
+def spot_feed(feed_id,empty_exception=False, since=None):
     """
-    Retrieve the last 50 messages from feed.
+    Retrieve the last 50 messages from feed, or if since (a unix time)
+    is given, all messages after since (up to SPOT_MAX_PAGES pages).
     Args:
         feed_id:  A spot feed identifier
     Returns:
-        list of 'message' objects.  Each message is a dict,
+        list of 'message' objects, newest first.  Each message is a dict,
         with attributes including "latitude" and "longitude" and "dateTime"
 
         Note list may be empty if there are no points to retrieve,
         unless empty_exception is set to True, in which case an
         exception is raised with the Spot error message. 
     """
+    if since is None:
+        return spot_feed_page(feed_id, { }, empty_exception)
+    # Spot's date range is inclusive, to the second
+    params = { "startDate": _spot_date(arrow.get(since + 1)),
+               "endDate": _spot_date(arrow.utcnow().replace(days=+1)) }
+    messages = [ ]
+    for page in range(SPOT_MAX_PAGES):
+        params["start"] = page * SPOT_PAGE_SIZE
+        batch = spot_feed_page(feed_id, params, empty_exception)
+        messages.extend(batch)
+        if len(batch) < SPOT_PAGE_SIZE:
+            break
+    return messages
+
+def _spot_date(a):
+    """Format arrow object a as Spot's API wants dates"""
+    return a.to("UTC").format("YYYY-MM-DDTHH:mm:ss") + "-0000"
+
+def spot_feed_page(feed_id, params, empty_exception=False):
+    """One request for messages from feed, with query params"""
     URL= URL_API.format(feed_id)
     # Old style http request:
     # response = urllib.request.urlopen(URL)
     # txt = response.read().decode("utf-8")
     # data=json.loads(txt)
-    # Using requests library:
-    r = requests.get(URL)
+    # Using requests library (via the shared upstream session),
+    # at the pace Spot asks of us:
+    spot_pacing.take()
+    r = upstream.get(URL, params=params)
     data = r.json()
     if "errors" in data["response"]:
         msg = data["response"]["errors"]["error"]["description"]
@@ -127,6 +127,14 @@ function Enroute(options) {
     console.log("Trackleader feeds: " + tl_feeds)
 
 
+    /* With the event name, the server measures riders' progress
+     * along their routes itself (see describe_progress_d)
+     */
+    var event_name = null;
+    if ('event' in options) {
+	    event_name = options.event;
+    }
+
     var utm_file = null;
     if ('utm_file' in options) {
 	    utm_file = options.utm_file;
@@ -262,7 +270,12 @@ function Enroute(options) {
     function chunk_spot_urls() { // Returns list of URL parameter strings for query_spot
         var spot_chunks = [ ]; // A list of URL parameter strings
         var spot_query_url= app_root + "_riders";
-        var parm_marker = "?feed=";
+        var first_marker = "?feed=";
+        if (event_name) {
+            spot_query_url += "?event=" + encodeURIComponent(event_name);
+            first_marker = "&feed=";
+        }
+        var parm_marker = first_marker;
         var cur_chunk = spot_query_url;
         var chunk_spot_count = 0
         for (var i=0; i < feeds.length; ++i) {
@@ -273,7 +286,7 @@ function Enroute(options) {
                 spot_chunks.push(cur_chunk);
                 cur_chunk = spot_query_url;
                 chunk_spot_count = 0;
-                parm_marker = "?feed=";
+                parm_marker = first_marker;
             }
         }
         if (chunk_spot_count > 0) {
@@ -311,6 +324,7 @@ function Enroute(options) {
 		        console.log("Received observation of tracker " + obs.id);
 		        show_track(obs);
 		    }
+		    flush_along_queue();
 	      });
 	     }
     }
@@ -341,6 +355,7 @@ function Enroute(options) {
 		        console.log("Received observation of tl tracker " + obs.id);
 		        show_track(obs);  /* Code in common with other spot tracks from here */
 		    }
+		    flush_along_queue();
 	      });
     }
 
@@ -409,6 +424,13 @@ function Enroute(options) {
 	    ensure_marker(rider);
 	    var marker = rider.marker;
 	    var time = observation.dateTime;
+	    /* Measured by the server already? */
+	    if (observation.hasOwnProperty("dist_km")) {
+	        rider.dist_km = observation.dist_km;
+	        bind_progress(rider, time, observation.dist_km);
+	        return;
+	    }
+
         var pos = observation.latlon; 
 	    /* pos is NOT a latlng object; it's a list of two elements */
 	    var lat = pos[0];
@@ -424,21 +446,60 @@ function Enroute(options) {
 	console.log("Querying for lat and lng " +
 		    lat + ", " + lng)
 	    console.log("  ... using distances file  " + distances);
-	    $.getJSON(app_root + "_along",
-		  { lat: lat,
-		    lng: lng,
-		    prior_lat: prior_lat,
-		    prior_lng: prior_lng, 
-		    track: distances
-		  },
-		  function (d) {
-		      var dist_km = d.result;
-		      var desc = "<p>" + rider.name + "<br />" + 
-			  time_desc(time) + "<br />" +
-			  dist_desc(dist_km) + "</p>";
-		      console.log("Binding description " + desc); 
-		      marker.bindPopup(desc);
-		  });
+	    var query = { lat: lat,
+			  lng: lng,
+			  prior_lat: prior_lat,
+			  prior_lng: prior_lng,
+			  track: distances
+			};
+	    /* Last distance we got for this rider, so the server can
+	     * search near it first
+	     */
+	    if (rider.hasOwnProperty("dist_km") && rider.dist_km >= 0) {
+		query.prior_km = rider.dist_km;
+	    }
+	    along_queue.push({ rider: rider, time: time, query: query });
+    }
+	
+    /* Distance queries from describe_progress_d wait in along_queue
+     * until a whole batch of observations has been shown; then
+     * flush_along_queue asks for all of them in one _along_batch request.
+     */
+    var along_queue = [ ];
+
+    function flush_along_queue() {
+	if (along_queue.length == 0) {
+	    return;
+	}
+	var pending = along_queue;
+	along_queue = [ ];
+	var queries = [ ];
+	for (var i=0; i < pending.length; ++i) {
+	    queries.push(pending[i].query);
+	}
+	console.log("Querying distances for " + queries.length + " riders");
+	$.ajax({ url: app_root + "_along_batch",
+		 type: "POST",
+		 contentType: "application/json",
+		 dataType: "json",
+		 data: JSON.stringify({ observations: queries }),
+		 success: function (d) {
+		     for (var i=0; i < pending.length; ++i) {
+			 var rider = pending[i].rider;
+			 rider.dist_km = d.result[i];
+			 bind_progress(rider, pending[i].time, d.result[i]);
+		     }
+		 }
+	       });
+    }
+
+    /* Popup with time of observation and distance along route */
+    function bind_progress(rider, time, dist_km) {
+	var desc = "<p>" + rider.name + "<br />" + 
+	    time_desc(time) + "<br />" +
+	    dist_desc(dist_km) + "</p>";
+	console.log("Binding description " + desc); 
+	rider.marker.bindPopup(desc);
     }
 	
     /* Describe progress as time alone, without distance */
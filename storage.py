@@ -0,0 +1,566 @@
+"""
+Storage for cached feeds and configuration, behind a small interface
+so that the database can be chosen by configuration:
+
+   storage_backend = mongo    MongoDB at mongo_url, as always
+   storage_backend = memory   Dicts in this process, each record
+                              expiring after storage_ttl_seconds
+                              (0 for never); for local load tests
+   storage_backend = sqlite   A local SQLite file (storage_sqlite_path)
+                              in WAL mode; for small deployments
+
+A Table holds records (dicts of JSON values) by key.  In MongoDB
+a table is a collection in which the key is the value of key_field,
+so tables read the same documents as before there were backends.  A
+Log holds entries (also dicts) for each key, ordered by time_field
+and unique by (time_field, id_field), such as the history of a Spot
+feed.  Records and entries come back as fresh dicts that callers are
+free to change.  Leases let one worker at a time (in any process,
+on any host sharing the backend) hold a key for a while, e.g., to
+refresh a feed.
+"""
+
+import bisect
+import copy
+import json
+import sqlite3
+import threading
+import time
+import uuid
+
+from pymongo import MongoClient, ReplaceOne, UpdateOne
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import PyMongoError, DuplicateKeyError
+
+import config
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+# Configurable ...
+STORAGE_BACKEND = config.get("storage_backend")
+
+
+class Table(object):
+    """Records by key"""
+
+    def get(self, key):
+        """The record for key, or None"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """Dict from key to record, for those of keys we have"""
+        raise NotImplementedError
+
+    def put(self, key, record):
+        """Store record for key, replacing any before"""
+        self.put_many({ key: record })
+
+    def put_many(self, records):
+        """Store each record in dict records by its key"""
+        raise NotImplementedError
+
+    def update_fields(self, key, fields):
+        """Set just fields (a dict from dotted paths, like
+        "latest.route_km", to values) in the record for key, if we
+        have it, leaving the rest as it is now
+        """
+        self.update_fields_many({ key: fields })
+
+    def update_fields_many(self, updates):
+        """update_fields for each key and fields in dict updates"""
+        raise NotImplementedError
+
+    def items(self):
+        """List of (key, record) for every record"""
+        raise NotImplementedError
+
+
+class Log(object):
+    """Time-ordered entries for each key"""
+
+    def append(self, key, entries):
+        """Add entries for key, skipping any we already have"""
+        raise NotImplementedError
+
+    def since(self, key, since=0, newest=False):
+        """Entries for key with time_field at least since, oldest
+        first (or newest first if newest is True)
+        """
+        raise NotImplementedError
+
+
+class Leases(object):
+    """Exclusive, expiring holds on keys"""
+
+    def acquire(self, key, seconds):
+        """A token if we now hold key for seconds, or None if someone
+        else holds it and their lease has not expired
+        """
+        raise NotImplementedError
+
+    def release(self, key, token):
+        """Give up key, if we still hold it with token"""
+        raise NotImplementedError
+
+    def remaining(self, key):
+        """Seconds until the lease on key expires (0 if it is not held)"""
+        raise NotImplementedError
+
+
+def _set_path(record, path, value):
+    """Set record at dotted path to value, as MongoDB's $set does"""
+    names = path.split(".")
+    for name in names[:-1]:
+        record = record.setdefault(name, { })
+    record[names[-1]] = value
+
+
+#
+# MongoDB
+#
+
+def _ensure_index(table, keys):
+    """Index table.collection by keys, on first use of the table
+    rather than at import, so that importing does not wait for an
+    unreachable server.  Tried again on later uses if it fails.
+    """
+    if table.indexed:
+        return
+    try:
+        table.collection.create_index(keys)
+        table.indexed = True
+    except PyMongoError as e:
+        log.warning("Could not index {}: {}".format(table.collection.name, e))
+
+
+class MongoTable(Table):
+
+    def __init__(self, collection, key_field):
+        self.collection = collection
+        self.key_field = key_field
+        self.indexed = False
+
+    def get_many(self, keys):
+        _ensure_index(self, self.key_field)
+        return { doc[self.key_field]: doc for doc in
+                 self.collection.find({ self.key_field: { "$in": list(keys) } },
+                                      { "_id": False }) }
+
+    def put_many(self, records):
+        _ensure_index(self, self.key_field)
+        if records:
+            self.collection.bulk_write(
+                [ ReplaceOne({ self.key_field: key },
+                             dict(record, **{ self.key_field: key }),
+                             upsert=True)
+                  for key, record in records.items() ])
+
+    def update_fields_many(self, updates):
+        _ensure_index(self, self.key_field)
+        if updates:
+            self.collection.bulk_write(
+                [ UpdateOne({ self.key_field: key }, { "$set": fields })
+                  for key, fields in updates.items() ])
+
+    def items(self):
+        return [ (doc[self.key_field], doc) for doc in
+                 self.collection.find({ self.key_field: { "$exists": True } },
+                                      { "_id": False }) ]
+
+
+class MongoLog(Log):
+
+    def __init__(self, collection, key_field, time_field, id_field):
+        self.collection = collection
+        self.key_field = key_field
+        self.time_field = time_field
+        self.id_field = id_field
+        self.indexed = False
+
+    def _ensure_index(self):
+        _ensure_index(self, [(self.key_field, ASCENDING),
+                             (self.time_field, ASCENDING)])
+
+    def append(self, key, entries):
+        self._ensure_index()
+        if entries:
+            self.collection.bulk_write(
+                [ UpdateOne({ self.key_field: key,
+                              self.time_field: entry[self.time_field],
+                              self.id_field: entry[self.id_field] },
+                            { "$setOnInsert": dict(entry,
+                                                   **{ self.key_field: key }) },
+                            upsert=True)
+                  for entry in entries ], ordered=False)
+
+    def since(self, key, since=0, newest=False):
+        self._ensure_index()
+        order = DESCENDING if newest else ASCENDING
+        return list(self.collection.find(
+            { self.key_field: key, self.time_field: { "$gte": since } },
+            { "_id": False }).sort(self.time_field, order))
+
+
+class MongoLeases(Leases):
+    """Leases are documents with _id the key.  Expiry times are by
+    the clocks of the workers, which should agree to within much
+    less than a lease.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def acquire(self, key, seconds):
+        token = uuid.uuid4().hex
+        now = time.time()
+        try:
+            # Matches only an expired lease; if there is none, the
+            # upsert inserts one, unless someone holds key
+            self.collection.update_one(
+                { "_id": key, "expires": { "$lt": now } },
+                { "$set": { "token": token, "expires": now + seconds } },
+                upsert=True)
+        except DuplicateKeyError:
+            return None
+        return token
+
+    def release(self, key, token):
+        self.collection.delete_one({ "_id": key, "token": token })
+
+    def remaining(self, key):
+        lease = self.collection.find_one({ "_id": key })
+        if lease is None:
+            return 0
+        return max(0, lease["expires"] - time.time())
+
+
+#
+# In this process
+#
+
+class MemoryTable(Table):
+
+    def __init__(self, ttl_seconds=0):
+        self.ttl_seconds = ttl_seconds
+        self._records = { }       # key -> (expires, record)
+        self._lock = threading.Lock()
+
+    def _expires(self):
+        if self.ttl_seconds:
+            return time.monotonic() + self.ttl_seconds
+        return None
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = { }
+        with self._lock:
+            for key in keys:
+                entry = self._records.get(key)
+                if entry is None:
+                    continue
+                expires, record = entry
+                if expires is not None and expires <= now:
+                    del self._records[key]
+                    continue
+                found[key] = copy.deepcopy(record)
+        return found
+
+    def put_many(self, records):
+        expires = self._expires()
+        with self._lock:
+            for key, record in records.items():
+                self._records[key] = (expires, copy.deepcopy(record))
+
+    def update_fields_many(self, updates):
+        with self._lock:
+            for key, fields in updates.items():
+                entry = self._records.get(key)
+                if entry is not None:
+                    for path, value in fields.items():
+                        _set_path(entry[1], path, copy.deepcopy(value))
+
+    def items(self):
+        with self._lock:
+            keys = list(self._records)
+        return list(self.get_many(keys).items())
+
+
+class MemoryLog(Log):
+
+    def __init__(self, time_field, id_field, ttl_seconds=0):
+        self.time_field = time_field
+        self.id_field = id_field
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires, times, entries, (time, id) of each entry),
+        # entries in order of time and times their time_field values
+        self._histories = { }
+        self._lock = threading.Lock()
+
+    def _history(self, key, now):
+        """The history of key, if it has not expired (lock held)"""
+        history = self._histories.get(key)
+        if history is not None and history[0] is not None \
+                and history[0] <= now:
+            del self._histories[key]
+            return None
+        return history
+
+    def append(self, key, entries):
+        now = time.monotonic()
+        expires = now + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            history = self._history(key, now)
+            if history is None:
+                _, times, have, seen = None, [ ], [ ], set()
+            else:
+                _, times, have, seen = history
+            added = False
+            for entry in entries:
+                entry_id = (entry[self.time_field], entry[self.id_field])
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    have.append(copy.deepcopy(entry))
+                    added = True
+            if added:
+                have.sort(key=lambda entry: entry[self.time_field])
+                times[:] = [ entry[self.time_field] for entry in have ]
+            self._histories[key] = (expires, times, have, seen)
+
+    def since(self, key, since=0, newest=False):
+        with self._lock:
+            history = self._history(key, time.monotonic())
+            if history is None:
+                return [ ]
+            _, times, have, _ = history
+            entries = have[bisect.bisect_left(times, since):]
+            entries = copy.deepcopy(entries)
+        if newest:
+            entries.reverse()
+        return entries
+
+
+class MemoryLeases(Leases):
+
+    def __init__(self):
+        self._leases = { }     # key -> (token, expires)
+        self._lock = threading.Lock()
+
+    def acquire(self, key, seconds):
+        now = time.monotonic()
+        with self._lock:
+            held = self._leases.get(key)
+            if held is not None and held[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._leases[key] = (token, now + seconds)
+            return token
+
+    def release(self, key, token):
+        with self._lock:
+            held = self._leases.get(key)
+            if held is not None and held[0] == token:
+                del self._leases[key]
+
+    def remaining(self, key):
+        with self._lock:
+            held = self._leases.get(key)
+        if held is None:
+            return 0
+        return max(0, held[1] - time.monotonic())
+
+
+#
+# SQLite
+#
+
+class SQLiteStore(object):
+    """A SQLite file in WAL mode, with a connection per thread"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+
+class SQLiteTable(Table):
+
+    def __init__(self, store, name):
+        self.store = store
+        self.name = "table_{}".format(name)
+        with store.connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS {} "
+                         "(key TEXT PRIMARY KEY, record TEXT)"
+                         .format(self.name))
+
+    def get_many(self, keys):
+        keys = list(keys)
+        found = { }
+        conn = self.store.connection()
+        # SQLite limits the parameters of one statement
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = conn.execute("SELECT key, record FROM {} WHERE key IN ({})"
+                                .format(self.name, ",".join("?" * len(chunk))),
+                                chunk)
+            for key, record in rows:
+                found[key] = json.loads(record)
+        return found
+
+    def put_many(self, records):
+        with self.store.connection() as conn:
+            conn.executemany("INSERT OR REPLACE INTO {} (key, record) "
+                             "VALUES (?, ?)".format(self.name),
+                             [ (key, json.dumps(record))
+                               for key, record in records.items() ])
+
+    def update_fields_many(self, updates):
+        conn = self.store.connection()
+        with conn:
+            # Read and write under the write lock, so no one writes
+            # between them
+            conn.execute("BEGIN IMMEDIATE")
+            for key, fields in updates.items():
+                row = conn.execute("SELECT record FROM {} WHERE key = ?"
+                                   .format(self.name), (key,)).fetchone()
+                if row is None:
+                    continue
+                record = json.loads(row[0])
+                for path, value in fields.items():
+                    _set_path(record, path, value)
+                conn.execute("UPDATE {} SET record = ? WHERE key = ?"
+                             .format(self.name), (json.dumps(record), key))
+
+    def items(self):
+        rows = self.store.connection().execute(
+            "SELECT key, record FROM {}".format(self.name))
+        return [ (key, json.loads(record)) for key, record in rows ]
+
+
+class SQLiteLog(Log):
+
+    def __init__(self, store, name, time_field, id_field):
+        self.store = store
+        self.name = "log_{}".format(name)
+        self.time_field = time_field
+        self.id_field = id_field
+        with store.connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS {} "
+                         "(key TEXT, time REAL, id TEXT, entry TEXT, "
+                         "PRIMARY KEY (key, time, id))".format(self.name))
+
+    def append(self, key, entries):
+        with self.store.connection() as conn:
+            conn.executemany("INSERT OR IGNORE INTO {} (key, time, id, entry) "
+                             "VALUES (?, ?, ?, ?)".format(self.name),
+                             [ (key, entry[self.time_field],
+                                str(entry[self.id_field]), json.dumps(entry))
+                               for entry in entries ])
+
+    def since(self, key, since=0, newest=False):
+        rows = self.store.connection().execute(
+            "SELECT entry FROM {} WHERE key = ? AND time >= ? "
+            "ORDER BY time {}".format(self.name, "DESC" if newest else "ASC"),
+            (key, since))
+        return [ json.loads(entry) for entry, in rows ]
+
+
+class SQLiteLeases(Leases):
+
+    def __init__(self, store, name):
+        self.store = store
+        self.name = "leases_{}".format(name)
+        with store.connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS {} "
+                         "(key TEXT PRIMARY KEY, token TEXT, expires REAL)"
+                         .format(self.name))
+
+    def acquire(self, key, seconds):
+        token = uuid.uuid4().hex
+        now = time.time()
+        # One transaction: the insert takes the write lock, so no
+        # one else can take key between it and the update.  (Not
+        # an upsert, which needs SQLite 3.24.)
+        with self.store.connection() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO {} (key, token, expires) "
+                "VALUES (?, ?, ?)".format(self.name),
+                (key, token, now + seconds))
+            if cursor.rowcount == 1:
+                return token
+            # Someone has held key; take it if their lease expired
+            cursor = conn.execute(
+                "UPDATE {} SET token = ?, expires = ? "
+                "WHERE key = ? AND expires < ?".format(self.name),
+                (token, now + seconds, key, now))
+            if cursor.rowcount != 1:
+                return None
+        return token
+
+    def release(self, key, token):
+        with self.store.connection() as conn:
+            conn.execute("DELETE FROM {} WHERE key = ? AND token = ?"
+                         .format(self.name), (key, token))
+
+    def remaining(self, key):
+        row = self.store.connection().execute(
+            "SELECT expires FROM {} WHERE key = ?".format(self.name),
+            (key,)).fetchone()
+        if row is None:
+            return 0
+        return max(0, row[0] - time.time())
+
+
+#
+# The configured backend
+#
+
+if STORAGE_BACKEND == "mongo":
+    # Performed once at instantiation
+    client = MongoClient(config.get("mongo_url"))
+    db = client.enroute
+elif STORAGE_BACKEND == "memory":
+    TTL_SECONDS = float(config.get("storage_ttl_seconds"))
+elif STORAGE_BACKEND == "sqlite":
+    sqlite_store = SQLiteStore(config.get("storage_sqlite_path"))
+else:
+    raise ValueError("Unknown storage_backend '{}'".format(STORAGE_BACKEND))
+
+def table(name, key_field):
+    """The Table called name, whose records are keyed by key_field"""
+    if STORAGE_BACKEND == "mongo":
+        return MongoTable(db[name], key_field)
+    elif STORAGE_BACKEND == "memory":
+        return MemoryTable(TTL_SECONDS)
+    else:
+        return SQLiteTable(sqlite_store, name)
+
+def log_table(name, key_field, time_field, id_field):
+    """The Log called name, of entries for each key_field ordered by
+    time_field and identified by (time_field, id_field)
+    """
+    if STORAGE_BACKEND == "mongo":
+        return MongoLog(db[name], key_field, time_field, id_field)
+    elif STORAGE_BACKEND == "memory":
+        return MemoryLog(time_field, id_field, TTL_SECONDS)
+    else:
+        return SQLiteLog(sqlite_store, name, time_field, id_field)
+
+def leases(name):
+    """The Leases called name"""
+    if STORAGE_BACKEND == "mongo":
+        return MongoLeases(db[name])
+    elif STORAGE_BACKEND == "memory":
+        return MemoryLeases()
+    else:
+        return SQLiteLeases(sqlite_store, name)
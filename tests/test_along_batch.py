@@ -0,0 +1,32 @@
+"""
+/_along_batch should answer each observation as /_along would, and
+reject a malformed body or observation with 400 rather than failing.
+"""
+
+import json
+import os
+
+# No MongoDB connection at import
+os.environ["storage_backend"] = "memory"
+import flask_enroute
+
+client = flask_enroute.app.test_client()
+def batch(body):
+    return client.post("/_along_batch", data=json.dumps(body),
+                       content_type="application/json")
+
+obs = { "track": "Alsea_dists.json", "lat": 44.258942, "lng": -123.292546 }
+good = batch({ "observations": [ obs, dict(obs, track="nope_dists.json") ] })
+assert good.status_code == 200
+single = client.get("/_along", query_string=obs).get_json()["result"]
+assert good.get_json()["result"] == [ single, 0 ]
+
+for body in [ [ obs ], { }, { "observations": obs },
+              { "observations": [ "Alsea" ] },
+              { "observations": [ dict(obs, lat="north") ] },
+              { "observations": [ { "track": "Alsea_dists.json" } ] },
+              { "observations": [ dict(obs, prior_km=[ 3 ]) ] },
+              { "observations": [ dict(obs, track=7) ] } ]:
+    assert batch(body).status_code == 400, body
+assert client.post("/_along_batch", data="{ not json",
+                   content_type="application/json").status_code == 400
@@ -0,0 +1,46 @@
+"""
+The distance memo should compute a result once, serve repeats
+(including positions a few centimeters apart) until it expires, and
+keep results for different directions of travel apart.
+"""
+
+import along_memo
+import time
+
+calls = [ ]
+def compute(value):
+    def f():
+        calls.append(value)
+        return value
+    return f
+
+route, other_route = object(), object()
+memo = along_memo.DistanceMemo(2, 0.2)
+
+at = along_memo.memo_key(route, 44.258942, -123.292546, (44.19, -123.28))
+near = along_memo.memo_key(route, 44.2589421, -123.2925461, (44.19, -123.28))
+assert at == near, "Centimeters apart is the same key"
+assert memo.get(at, route, compute(57.3)) == 57.3
+assert memo.get(near, route, compute(0)) == 57.3, "Repeat is remembered"
+assert calls == [57.3]
+
+# Southbound, or on another route, is a different question
+south = along_memo.memo_key(route, 44.258942, -123.292546, (44.31, -123.30))
+assert south != at
+assert at != along_memo.memo_key(other_route, 44.258942, -123.292546,
+                                 (44.19, -123.28))
+assert memo.get(south, route, compute(159.0)) == 159.0
+assert calls == [57.3, 159.0]
+
+# No prior, or a prior at the same place, means no direction
+assert along_memo.memo_key(route, 44.2, -123.2) == \
+  along_memo.memo_key(route, 44.2, -123.2, (44.2, -123.2))
+
+time.sleep(0.25)
+assert memo.get(at, route, compute(57.4)) == 57.4, "Expired is recomputed"
+stats = memo.stats()
+assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 3, 1)
+
+# Room for only two
+memo.get(along_memo.memo_key(route, 45.0, -122.0), route, compute(1.0))
+assert memo.stats()["evictions"] == 1
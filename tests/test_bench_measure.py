@@ -0,0 +1,24 @@
+"""
+The benchmark should generate the same observations every run, and
+report a route as slower only beyond the tolerance. 
+"""
+
+import bench_measure
+import json
+
+with open("static/routes/Alsea_dists.json") as f:
+    track_obj = json.load(f)
+first = bench_measure.observations(track_obj["path"], track_obj["zone"], 7, 5)
+again = bench_measure.observations(track_obj["path"], track_obj["zone"], 7, 5)
+assert first == again, "Observations are reproducible"
+assert len(first) == 30, "5 each of on, near, off, with and without prior"
+assert sum(1 for obs in first if obs[3] is not None) == 15
+
+times = bench_measure.percentiles([0.001 * i for i in range(1, 101)])
+assert times["p50"] == 50.0 and times["p90"] == 90.0 and times["max"] == 100.0
+
+baseline = { "Alsea": { "lookup_ms": { "grid": { "p50": 0.10, "p90": 0.20 } } } }
+results = { "Alsea": { "lookup_ms": { "grid": { "p50": 0.12, "p90": 0.30 },
+                                      "raster": { "p50": 0.1, "p90": 0.1 } } } }
+regressions = bench_measure.compare(results, baseline, 1.25)
+assert len(regressions) == 1 and "grid p90" in regressions[0], regressions
@@ -0,0 +1,52 @@
+"""
+Threads asking a SingleFlight for the same key at once should share
+one call and its result (or exception); other keys run separately.
+"""
+
+import threading
+import time
+
+import coalesce
+
+flight = coalesce.SingleFlight()
+ran = [ ]
+
+def slow(key):
+    ran.append(key)
+    time.sleep(0.1)
+    return "result of {}".format(key)
+
+results = [ ]
+def ask(key):
+    results.append(flight.do(key, slow, key))
+
+threads = [ threading.Thread(target=ask, args=(key,))
+            for key in ["a"] * 5 + ["b"] * 3 ]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert sorted(ran) == ["a", "b"], ran
+assert results.count("result of a") == 5 and results.count("result of b") == 3
+assert flight.stats() == { "calls": 2, "joined": 6, "in_flight": 0 }
+
+# Once done, the next call runs again
+assert flight.do("a", slow, "a") == "result of a"
+assert ran.count("a") == 2
+
+# Waiting callers get the exception too
+def fail():
+    time.sleep(0.1)
+    raise ValueError("no feed")
+errors = [ ]
+def ask_fail():
+    try:
+        flight.do("c", fail)
+    except ValueError as e:
+        errors.append(str(e))
+threads = [ threading.Thread(target=ask_fail) for _ in range(3) ]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert errors == ["no feed"] * 3, errors
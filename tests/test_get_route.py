@@ -0,0 +1,27 @@
+"""
+/_get_route should serve a route's points with an ETag and
+Last-Modified, answer revalidation with 304, and reject a request
+with no route (400) or an unknown one, or a file that is not an
+array of points (404).
+"""
+
+import os
+
+# No MongoDB connection at import
+os.environ["storage_backend"] = "memory"
+import flask_enroute
+
+client = flask_enroute.app.test_client()
+first = client.get("/_get_route?route=Alsea_points.json")
+assert first.status_code == 200
+with open("static/routes/Alsea_points.json") as f:
+    assert first.data.decode("utf-8") == f.read()
+etag = first.headers["ETag"]
+assert client.get("/_get_route?route=Alsea_points.json",
+                  headers={ "If-None-Match": etag }).status_code == 304
+assert client.get("/_get_route?route=Alsea_points.json",
+                  headers={ "If-Modified-Since":
+                            first.headers["Last-Modified"] }).status_code == 304
+assert client.get("/_get_route").status_code == 400
+assert client.get("/_get_route?route=nope_points.json").status_code == 404
+assert client.get("/_get_route?route=Alsea_dists.json").status_code == 404
@@ -0,0 +1,40 @@
+"""
+A shared pacer should space takes (from any number of threads, in
+any number of processes sharing its leases) at its rate, waiting
+out a lease rather than asking for it again and again.
+"""
+
+import os
+# No MongoDB connection at import
+os.environ["storage_backend"] = "memory"
+
+import pacing
+import storage
+import threading
+import time
+
+class CountedLeases(storage.MemoryLeases):
+    """Leases that count attempts to acquire them"""
+    attempts = 0
+    def acquire(self, key, seconds):
+        self.attempts += 1
+        return super().acquire(key, seconds)
+
+# Two processes' pacers on the same leases, each taking from two
+# threads: eight takes need 7/20 seconds
+leases = CountedLeases()
+pacers = [ pacing.SharedPacer(leases, "pacing", 20) for _ in range(2) ]
+def take_twice(pacer):
+    for _ in range(2):
+        pacer.take()
+start = time.monotonic()
+threads = [ threading.Thread(target=take_twice, args=(pacer,))
+            for pacer in pacers for _ in range(2) ]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+elapsed = time.monotonic() - start
+assert 0.34 < elapsed < 0.55, elapsed
+# Each take waits out at most about one lease per other process
+assert leases.attempts <= 8 * 3, leases.attempts
@@ -0,0 +1,80 @@
+"""
+prep_routes should prepare each route in worker processes, skip one
+whose GPX file and options are unchanged (unless --force), name a
+single GPX file's route by --prefix, take prefixes from manifests,
+refuse two routes with one prefix, and keep its record of hashes
+where it is told (not in the served route directory).
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import prep_routes
+
+work = tempfile.mkdtemp()
+try:
+    gpx_dir = os.path.join(work, "gpx")
+    out_dir = os.path.join(work, "routes")
+    hashes_path = os.path.join(work, "hashes.json")
+    os.mkdir(gpx_dir)
+    os.mkdir(out_dir)
+    for name in [ "first.gpx", "second.gpx" ]:
+        shutil.copy("static/routes/DariDart.gpx", os.path.join(gpx_dir, name))
+    common = [ "--out", out_dir, "--hashes", hashes_path, "--workers", "2" ]
+
+    def prepared():
+        """Modification times of the prepared route files"""
+        return { name: os.stat(os.path.join(out_dir, name)).st_mtime_ns
+                 for name in os.listdir(out_dir) }
+
+    # Both routes, from the directory, in a pool of two processes
+    prep_routes.main([ gpx_dir ] + common)
+    first = prepared()
+    for prefix in [ "first", "second" ]:
+        assert prefix + "_points.json" in first
+        assert prefix + "_dists.json" in first
+    assert os.path.exists(hashes_path)
+    assert not any(name.endswith("hashes.json") for name in first)
+
+    # Unchanged: nothing written again
+    prep_routes.main([ gpx_dir ] + common)
+    assert prepared() == first
+
+    # --force, or other options, prepare again
+    for options in [ [ "--force" ], [ "--delta", "50" ] ]:
+        for name in first:
+            os.utime(os.path.join(out_dir, name), ns=(0, 0))
+        prep_routes.main([ gpx_dir ] + options + common)
+        assert all(mtime != 0 for mtime in prepared().values()), options
+
+    # A single GPX file named by --prefix
+    prep_routes.main([ os.path.join(gpx_dir, "first.gpx"),
+                       "--prefix", "renamed" ] + common)
+    assert "renamed_dists.json" in prepared()
+
+    # A manifest's prefixes apply only to its own routes
+    manifest = os.path.join(gpx_dir, "manifest.txt")
+    with open(manifest, "w") as f:
+        f.write("# Route  prefix\n\nfirst.gpx  alpha\n")
+    second = os.path.join(gpx_dir, "second.gpx")
+    assert prep_routes.route_sources([ manifest, second ]) == [
+        (os.path.join(gpx_dir, "first.gpx"), "alpha"), (second, "second") ]
+
+    # Two routes with one prefix: the first is prepared, the other not
+    for name in os.listdir(out_dir):
+        os.remove(os.path.join(out_dir, name))
+    try:
+        prep_routes.main([ os.path.join(gpx_dir, "first.gpx"), second,
+                           "--prefix", "same" ] + common)
+        assert False, "Duplicate prefix is not an error"
+    except SystemExit as e:
+        assert e.code == 1
+    assert "same_dists.json" in prepared()
+    with open(hashes_path) as f:
+        recorded = json.load(f)[os.path.join(out_dir, "same")]
+    assert recorded == prep_routes.source_hash(
+        os.path.join(gpx_dir, "first.gpx"), 30)
+finally:
+    shutil.rmtree(work)
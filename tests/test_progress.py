@@ -0,0 +1,44 @@
+"""
+Progress of a rider measured on the server should agree with what 
+/_along reports, be reused while the observation is unchanged, and 
+be skipped for a route with no distances. 
+"""
+
+import progress
+import route_cache
+import measure
+
+Cheshire_Territorial = [44.190241,	-123.282513]
+Territorial_South = [44.258942,	-123.292546]
+Territorial_Monroe = [44.309515,	-123.296244]
+
+route = route_cache.distances(progress.distances_path("Alsea"))
+northbound = { "dateTime": "2018-06-12T18:17:23+00:00",
+               "latlon": Territorial_South,
+               "prior_position": Cheshire_Territorial }
+km = progress.add_progress(northbound, "Alsea")
+assert km == measure.interpolate_route_distance(
+    Territorial_South[0], Territorial_South[1], route.prepared, route.zone,
+    tuple(Cheshire_Territorial))
+assert northbound["route_km"] == { "Alsea": km }
+
+# Same observation again is not measured again
+again = dict(northbound, route_km={ })
+again_km = progress.add_progress(again, "Alsea",
+                                 { "dateTime": northbound["dateTime"],
+                                   "latlon": Territorial_South,
+                                   "route_km": { "Alsea": 1234.0 } })
+assert again_km == 1234.0
+
+# Southbound, later in the ride, searching near the last distance
+southbound = { "dateTime": "2018-06-12T23:17:23+00:00",
+               "latlon": Territorial_South,
+               "prior_position": Territorial_Monroe }
+south_km = progress.add_progress(southbound, "Alsea", northbound)
+assert south_km == measure.interpolate_route_distance(
+    Territorial_South[0], Territorial_South[1], route.prepared, route.zone,
+    tuple(Territorial_Monroe), hint_km=km)
+assert south_km > 150, south_km
+
+assert progress.add_progress(dict(northbound), "No-such-route") is None
+assert progress.add_progress(dict(northbound), "dotted.route") is None
@@ -0,0 +1,62 @@
+"""
+With a hint of the rider's last known distance along the route,
+interpolate_route_distance should prefer the nearby part of the 
+route, and fall back to searching the whole route when nothing 
+near the hint is close to the observation. 
+
+The Alsea Loop passes Territorial Road south of Monroe twice, 
+northbound near 57km and southbound near 159km.  Without a direction
+of travel, only the hint can tell them apart.  A route raster, which
+keeps only the segments nearest each place, must not lose the pass
+near the hint. 
+"""
+
+import measure
+import json
+import utm
+
+Territorial_South = (44.258942,	-123.292546)
+
+def hinted(hint_km, track_obj, **kwargs):
+    lat, lon = Territorial_South
+    return measure.interpolate_route_distance(
+        lat, lon, track_obj["path"], track_obj["zone"],
+        hint_km=hint_km, **kwargs)
+
+def check(track_obj, **kwargs):
+    assert 50 < hinted(50.0, track_obj, **kwargs) < 65, "First pass"
+    assert 150 < hinted(150.0, track_obj, **kwargs) < 165, "Second pass"
+    # A window beyond the end of the route falls back to global search
+    assert hinted(500.0, track_obj, **kwargs) == \
+      hinted(None, track_obj, **kwargs)
+
+with open("static/routes/Alsea_dists.json") as f:
+    track_obj = json.load(f)
+
+check(track_obj)
+check(track_obj, index=measure.SegmentGrid(track_obj["path"]))
+if measure.np is not None:
+    check(track_obj, index=measure.build_route_raster(
+        measure.RouteArrays.from_path(track_obj["path"])))
+
+    # Out 200km and back on a road 800m to the north.  An observation
+    # 200m from the way back is nearer it than the way out, but a
+    # rider 8km along is on the way out.
+    path = [ [ 300000 + 1000 * i, 5000000, float(i) ] for i in range(201) ]
+    path += [ [ 300000 + 1000 * i, 5000800, 200.8 + (200 - i) ]
+              for i in range(200, -1, -1) ]
+    lat, lon = utm.to_latlon(310500, 5000600, 10, northern=True)
+    raster = measure.build_route_raster(measure.RouteArrays.from_path(path))
+    for index in [ None, measure.SegmentGrid(path), raster ]:
+        def along(hint_km):
+            return measure.interpolate_route_distance(
+                lat, lon, path, 10, index=index, hint_km=hint_km)
+        assert abs(along(8.0) - 10.5) < 0.01, (index, along(8.0))
+        assert abs(along(385.0) - 390.3) < 0.01, index
+        assert abs(along(None) - 390.3) < 0.01, index
+saved = measure.np
+measure.np = None
+try:
+    check(track_obj)
+finally:
+    measure.np = saved
@@ -0,0 +1,80 @@
+"""
+/_riders should answer a repeat request for unchanged feeds with 304
+Not Modified (in any order of the same feeds), and send new tracks
+with a new ETag once a feed has been queried again, or a rider is
+moved to another route (read again only when the event file changes).
+"""
+
+import os
+import arrow
+
+# No MongoDB connection at import
+os.environ["storage_backend"] = "memory"
+import flask_enroute
+import spot
+
+# Fresh records, so we need not ask Spot
+now = arrow.now().isoformat()
+for feed, lat in [ ("feed-a", 44.2), ("feed-b", 44.3) ]:
+    spot.tracks.put(feed, { "id": feed, "last_query_time": now,
+                            "latest": { "dateTime": now,
+                                        "latlon": [ lat, -123.28 ] },
+                            "path": [ ] })
+
+client = flask_enroute.app.test_client()
+first = client.get("/_riders?feed=feed-a&feed=feed-b")
+assert first.status_code == 200
+assert first.headers["Cache-Control"] == "no-cache"
+etag = first.headers["ETag"]
+assert [ track["id"] for track in first.get_json() ] == ["feed-a", "feed-b"]
+
+again = client.get("/_riders?feed=feed-b&feed=feed-a",
+                   headers={ "If-None-Match": etag })
+assert again.status_code == 304
+assert again.headers["ETag"] == etag
+assert again.data == b""
+
+# Other feeds, other ETag
+just_a = client.get("/_riders?feed=feed-a", headers={ "If-None-Match": etag })
+assert just_a.status_code == 200 and just_a.headers["ETag"] != etag
+
+# A feed queried again
+record = spot.tracks.get("feed-b")
+record["last_query_time"] = arrow.now().isoformat()
+record["latest"]["latlon"] = [ 44.31, -123.28 ]
+spot.tracks.put("feed-b", record)
+changed = client.get("/_riders?feed=feed-a&feed=feed-b",
+                     headers={ "If-None-Match": etag })
+assert changed.status_code == 200
+assert changed.headers["ETag"] != etag
+assert changed.get_json()[1]["latest"]["latlon"] == [ 44.31, -123.28 ]
+
+# A rider moved to another route in the event
+tracks = [ spot.tracks.get("feed-a") ]
+on_a = flask_enroute.riders_etag(["feed-a"], "event", { "feed-a": "A" },
+                                 tracks)
+on_b = flask_enroute.riders_etag(["feed-a"], "event", { "feed-a": "B" },
+                                 tracks)
+assert on_a != on_b
+assert on_a == flask_enroute.riders_etag(["feed-a"], "event",
+                                         { "feed-a": "A", "other": "B" },
+                                         tracks)
+
+# An event's riders' routes are read again only when its file changes
+path = os.path.join("events", "test-riders-etag.csv")
+try:
+    with open(path, "w") as f:
+        f.write("route,A,Route A\nroute,B,Route B\n"
+                "spot,A,Rider,feed-a,#000000\n")
+    assert flask_enroute.rider_routes("test-riders-etag") == { "feed-a": "A" }
+    hits = flask_enroute.event_routes.hits
+    assert flask_enroute.rider_routes("test-riders-etag") == { "feed-a": "A" }
+    assert flask_enroute.event_routes.hits == hits + 1
+    with open(path, "w") as f:
+        f.write("route,A,Route A\nroute,B,Route B\n"
+                "spot,B,Rider,feed-a,#000000\n")
+    os.utime(path, ns=(0, 0))
+    assert flask_enroute.rider_routes("test-riders-etag") == { "feed-a": "B" }
+finally:
+    os.remove(path)
+assert flask_enroute.rider_routes("test-riders-etag") == { }
@@ -0,0 +1,38 @@
+"""
+A route written in packed binary form and memory-mapped back should
+measure exactly as the JSON distances file it came from. 
+"""
+
+import measure
+import json
+import os
+import tempfile
+
+Cheshire_Territorial = (44.190241,	-123.282513)
+Territorial_South = (44.258942,	-123.292546)
+Territorial_Monroe = (44.309515,	-123.296244)
+
+if measure.np is None:
+    print("numpy is not installed; no binary route files")
+else:
+    with open("static/routes/Alsea_dists.json") as f:
+        track_obj = json.load(f)
+    fd, binary_path = tempfile.mkstemp(suffix="_dists.bin")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            measure.write_route_binary(f, track_obj["path"], track_obj["zone"])
+        mapped, zone = measure.read_route_binary(binary_path)
+        parsed = measure.RouteArrays.from_path(track_obj["path"])
+        assert zone == track_obj["zone"]
+        assert len(mapped) == len(track_obj["path"])
+        for to_point, from_point in [(Territorial_South, Cheshire_Territorial),
+                                     (Territorial_South, Territorial_Monroe),
+                                     (Territorial_South, None)]:
+            lat, lon = to_point
+            assert measure.interpolate_route_distance(
+                lat, lon, mapped, zone, from_point) == \
+              measure.interpolate_route_distance(
+                lat, lon, parsed, zone, from_point)
+        del mapped
+    finally:
+        os.remove(binary_path)
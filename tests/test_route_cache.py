@@ -0,0 +1,73 @@
+"""
+The route cache should parse a route file once, serve repeat 
+lookups from memory, reload a file that has changed, and evict the
+least recently used route when full. 
+"""
+
+import route_cache
+import json
+import os
+import shutil
+import tempfile
+
+def counts(cache):
+    stats = cache.stats()
+    return stats["hits"], stats["misses"], stats["evictions"]
+
+workdir = tempfile.mkdtemp()
+try:
+    alsea = os.path.join(workdir, "Alsea_dists.json")
+    eden = os.path.join(workdir, "eden_dists.json")
+    shutil.copy("static/routes/Alsea_dists.json", alsea)
+    shutil.copy("static/routes/eden_dists.json", eden)
+    cache = route_cache.RouteCache(1)
+
+    route = cache.get(alsea, route_cache._load_distances)
+    assert counts(cache) == (0, 1, 0), "First lookup is a miss"
+    assert cache.get(alsea, route_cache._load_distances) is route, \
+      "Second lookup is the same object"
+    assert counts(cache) == (1, 1, 0), "Second lookup is a hit"
+    assert route.zone == 10 and len(route.prepared) > 0
+
+    # Rewriting the file (with a later mtime) forces a reload
+    with open(alsea) as f:
+        track_obj = json.load(f)
+    track_obj["path"] = track_obj["path"][:10]
+    with open(alsea, "w") as f:
+        json.dump(track_obj, f)
+    stat = os.stat(alsea)
+    os.utime(alsea, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reloaded = cache.get(alsea, route_cache._load_distances)
+    assert len(reloaded.prepared) == 10, "Changed file is reloaded"
+    assert counts(cache) == (1, 2, 0)
+    assert cache.stats()["invalidations"] == 1
+
+    # Room for only one route
+    cache.get(eden, route_cache._load_distances)
+    assert counts(cache) == (1, 3, 1), "Least recently used is evicted"
+    cache.get(alsea, route_cache._load_distances)
+    assert counts(cache) == (1, 4, 2), "Evicted route is loaded again"
+
+    try:
+        cache.get(os.path.join(workdir, "missing_dists.json"),
+                  route_cache._load_distances)
+        assert False, "Missing file should raise"
+    except FileNotFoundError:
+        pass
+
+    # A packed _dists.bin is used only while no older than the JSON
+    if route_cache.measure.np is not None:
+        binary = alsea[:-len(".json")] + ".bin"
+        with open(binary, "wb") as f:
+            route_cache.measure.write_route_binary(f, track_obj["path"][:5],
+                                                   track_obj["zone"])
+        stat = os.stat(alsea)
+        os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert len(route_cache.distances(alsea).prepared) == 5, \
+          "Up to date binary is used"
+        # JSON prepared again, without the binary
+        os.utime(alsea, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        assert len(route_cache.distances(alsea).prepared) == 10, \
+          "Stale binary does not shadow the JSON"
+finally:
+    shutil.rmtree(workdir)
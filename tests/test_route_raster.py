@@ -0,0 +1,43 @@
+"""
+Distances measured with a route raster, built and memory-mapped back,
+should be exactly those from searching the whole route, whichever 
+way the rider is travelling (or if we don't know). 
+"""
+
+import measure
+import json
+import os
+import random
+import tempfile
+
+import utm
+
+if measure.np is None:
+    print("numpy is not installed; no route rasters")
+else:
+    with open("static/routes/Alsea_dists.json") as f:
+        track_obj = json.load(f)
+    path, zone = track_obj["path"], track_obj["zone"]
+    route = measure.RouteArrays.from_path(path)
+    fd, raster_path = tempfile.mkstemp(suffix="_raster.bin")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            measure.write_route_raster(f, measure.build_route_raster(route))
+        raster = measure.read_route_raster(raster_path)
+        # Nothing near a point far off the route
+        assert len(raster.candidates(0.0, 0.0)) == 0
+        random.seed(42)
+        for _ in range(300):
+            east, north, _ = random.choice(path)
+            east += random.uniform(-2500, 2500)
+            north += random.uniform(-2500, 2500)
+            lat, lon = utm.to_latlon(east, north, zone, northern=True)
+            prior = random.choice([None, (lat, lon), utm.to_latlon(
+                east + random.uniform(-300, 300),
+                north + random.uniform(-300, 300), zone, northern=True)])
+            assert measure.interpolate_route_distance(
+                lat, lon, route, zone, prior, index=raster) == \
+              measure.interpolate_route_distance(lat, lon, route, zone, prior)
+        del raster
+    finally:
+        os.remove(raster_path)
@@ -0,0 +1,50 @@
+"""
+The SegmentGrid index must not change any distance-along-route
+result; it only saves us from measuring segments that are too far
+away to matter.  We check on the Alsea Loop route with the same
+sample points as test_dist_vectors, plus every route vertex 
+nudged off the route, with and without a direction of travel. 
+"""
+
+import measure
+import json
+
+Cheshire_Territorial = (44.190241,	-123.282513)
+Territorial_South = (44.258942,	-123.292546)
+Territorial_Monroe = (44.309515,	-123.296244)
+HighPass_Dorsey = (44.215203, -123.240302)
+Alvadore_36 = (44.193785,	-123.242134)
+Alvadore_south = (44.143246, 	-123.259785)
+Far_away = (45.52, -122.68)       # Portland; nowhere near Alsea
+dists_path = "static/routes/Alsea_dists.json"
+points_path = "static/routes/Alsea_points.json"
+
+def both_ways(to_point, from_point, track_obj, grid):
+    lat, lon = to_point
+    plain = measure.interpolate_route_distance(
+        lat, lon, track_obj["path"], track_obj["zone"],
+        prior_obs=from_point)
+    indexed = measure.interpolate_route_distance(
+        lat, lon, track_obj["path"], track_obj["zone"],
+        prior_obs=from_point, index=grid)
+    assert plain == indexed, \
+      "Index changed result at {}: {} vs {}".format(to_point, plain, indexed)
+    return indexed
+
+with open(dists_path) as track, open(points_path) as points:
+    track_obj = json.load(track)
+    route_points = json.load(points)
+    grid = measure.SegmentGrid(track_obj["path"])
+
+    both_ways(Territorial_South, Cheshire_Territorial, track_obj, grid)
+    both_ways(Territorial_South, Territorial_Monroe, track_obj, grid)
+    both_ways(Alvadore_36, HighPass_Dorsey, track_obj, grid)
+    assert both_ways(Alvadore_36, Alvadore_south, track_obj, grid) < 0
+    assert both_ways(Far_away, None, track_obj, grid) < 0
+
+    prior = route_points[0]
+    for lat, lon in route_points[::5]:
+        nudged = (lat + 0.001, lon - 0.001)
+        both_ways(nudged, None, track_obj, grid)
+        both_ways(nudged, prior, track_obj, grid)
+        prior = (lat, lon)
@@ -0,0 +1,38 @@
+"""
+Douglas-Peucker simplification in projected coordinates:  the NumPy 
+and pure-Python versions keep the same vertices, endpoints and 
+corners are kept, and wiggles within tolerance are dropped. 
+"""
+
+import measure
+import json
+
+def both_ways(east, north, tolerance):
+    kept = measure.douglas_peucker(east, north, tolerance)
+    saved = measure.np
+    measure.np = None
+    try:
+        assert measure.douglas_peucker(east, north, tolerance) == kept, \
+          "Vectorized and pure-Python simplification differ"
+    finally:
+        measure.np = saved
+    return kept
+
+# A straight road with 10m wiggles, then a right turn
+east = [ 0, 100, 200, 300, 400, 500, 500, 500 ]
+north = [ 0, 10, -10, 10, -10, 0, 100, 200 ]
+assert both_ways(east, north, 30) == [0, 5, 7]
+assert both_ways(east, north, 5) == [0, 1, 2, 3, 4, 5, 7]
+assert both_ways([0, 1], [0, 1], 30) == [0, 1]
+
+# A closed loop (start == end) is not collapsed
+assert both_ways([0, 100, 100, 0, 0], [0, 0, 100, 100, 0], 30) == \
+  [0, 1, 2, 3, 4]
+
+with open("static/routes/Alsea_dists.json") as f:
+    path = json.load(f)["path"]
+east = [ pt[0] for pt in path ]
+north = [ pt[1] for pt in path ]
+kept = both_ways(east, north, 100)
+assert kept[0] == 0 and kept[-1] == len(path) - 1
+assert len(kept) < len(path)
@@ -0,0 +1,50 @@
+"""
+A Spot query that fails (here, times out) should cost only its own
+feed: the others in the batch are still returned and cached.
+"""
+
+import os
+import arrow
+import requests
+
+# No MongoDB connection at import
+os.environ["storage_backend"] = "memory"
+import spot
+
+now = arrow.utcnow()
+def page(feed_id, params, empty_exception=False):
+    if feed_id == "slow":
+        raise requests.exceptions.ReadTimeout("Spot took too long")
+    if feed_id == "garbled":
+        raise ValueError("Expecting value: line 1 column 1 (char 0)")
+    return [ { "id": 1, "unixTime": now.timestamp,
+               "dateTime": now.isoformat(), "messageType": "TRACK",
+               "latitude": 44.2, "longitude": -123.28,
+               "batteryState": "GOOD" } ]
+spot.spot_feed_page = page
+
+feeds = spot.get_feeds(["good", "slow", "garbled"])
+assert [ feed["id"] for feed in feeds ] == ["good"]
+assert spot.tracks.get("good")["latest"]["latlon"] == [44.2, -123.28]
+# Nothing is stored for failed feeds, so they are tried again next time
+assert spot.tracks.get("slow") is None
+
+# Measuring a fresh record along a route writes just the distance, so
+# a record another worker refreshed after we read it is not lost
+fresh = { "id": "fresh", "last_query_time": arrow.now().isoformat(),
+          "latest": { "dateTime": now.isoformat(),
+                      "latlon": [44.258942, -123.292546] },
+          "path": [ ] }
+spot.tracks.put("fresh", fresh)
+read = spot.tracks.get_many
+def read_then_refreshed_elsewhere(keys):
+    records = read(keys)
+    spot.tracks.put("fresh", dict(fresh, newest_unix_time=now.timestamp))
+    return records
+spot.tracks.get_many = read_then_refreshed_elsewhere
+feeds = spot.get_feeds(["fresh"], { "fresh": "Alsea" })
+spot.tracks.get_many = read
+stored = spot.tracks.get("fresh")
+assert stored["newest_unix_time"] == now.timestamp
+assert stored["latest"]["route_km"] == feeds[0]["latest"]["route_km"]
+assert "Alsea" in stored["latest"]["route_km"]
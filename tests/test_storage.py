@@ -0,0 +1,128 @@
+"""
+The in-process and SQLite storage backends should keep records
+and message logs the same way (the Mongo backend needs a server).
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+# No MongoDB connection at import
+os.environ["storage_backend"] = "memory"
+import storage
+
+tmp = tempfile.mkdtemp()
+sqlite_store = storage.SQLiteStore(os.path.join(tmp, "test.sqlite3"))
+
+tables = { "memory": storage.MemoryTable(),
+           "sqlite": storage.SQLiteTable(sqlite_store, "tracks") }
+for name, table in tables.items():
+    assert table.get("a") is None, name
+    table.put_many({ "a": { "id": "a", "latest": { "latlon": [44.0, -123.0] } },
+                     "b": { "id": "b", "path": [ ] } })
+    assert set(table.get_many(["a", "b", "c"])) == { "a", "b" }, name
+    record = table.get("a")
+    assert record["latest"]["latlon"] == [44.0, -123.0], name
+    # Changing what we read does not change what is stored
+    record["latest"]["route_km"] = { "BC": 12.5 }
+    assert "route_km" not in table.get("a")["latest"], name
+    table.put("a", record)
+    assert table.get("a")["latest"]["route_km"] == { "BC": 12.5 }, name
+    assert sorted(key for key, _ in table.items()) == ["a", "b"], name
+
+# Many keys at once
+table = tables["sqlite"]
+table.put_many({ str(i): { "id": str(i) } for i in range(1200) })
+assert len(table.get_many(str(i) for i in range(1200))) == 1200
+
+# Memory records expire
+table = storage.MemoryTable(ttl_seconds=0.05)
+table.put("a", { "id": "a" })
+assert table.get("a") is not None
+time.sleep(0.06)
+assert table.get("a") is None
+assert table.items() == [ ]
+
+logs = { "memory": storage.MemoryLog("unixTime", "id"),
+         "sqlite": storage.SQLiteLog(sqlite_store, "messages",
+                                     "unixTime", "id") }
+for name, history in logs.items():
+    history.append("f1", [ { "id": 3, "unixTime": 300 },
+                           { "id": 1, "unixTime": 100 } ])
+    # Repeats are skipped
+    history.append("f1", [ { "id": 3, "unixTime": 300 },
+                           { "id": 2, "unixTime": 200 } ])
+    history.append("f2", [ { "id": 9, "unixTime": 150 } ])
+    assert [ e["id"] for e in history.since("f1") ] == [1, 2, 3], name
+    assert [ e["id"] for e in history.since("f1", 200, newest=True) ] == [3, 2], name
+    assert history.since("f3") == [ ], name
+    # Entries returned are the caller's to change
+    history.since("f1")[0]["id"] = 99
+    assert history.since("f1")[0]["id"] == 1, name
+
+# Log histories expire, like records
+history = storage.MemoryLog("unixTime", "id", ttl_seconds=0.05)
+history.append("f1", [ { "id": 1, "unixTime": 100 } ])
+time.sleep(0.06)
+assert history.since("f1") == [ ]
+
+# Mongo tables are indexed on first use, not when made (at import)
+class Collection(object):
+    """Just enough of a pymongo collection"""
+    name = "collection"
+    indexes = 0
+    def create_index(self, keys):
+        self.indexes += 1
+    def find(self, query, projection):
+        return [ ]
+collection = Collection()
+mongo_table = storage.MongoTable(collection, "id")
+assert collection.indexes == 0
+assert mongo_table.get("a") is None and mongo_table.items() == [ ]
+mongo_table.get("b")
+assert collection.indexes == 1
+
+# SQLite from several threads at once, each with its own connection
+def put_some(n):
+    other = storage.SQLiteTable(sqlite_store, "threads")
+    other.put_many({ "{}-{}".format(n, i): { "n": n } for i in range(50) })
+threads = [ threading.Thread(target=put_some, args=(n,)) for n in range(4) ]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert len(storage.SQLiteTable(sqlite_store, "threads").items()) == 200
+
+# Leases: one holder at a time until released or expired
+for leases in [ storage.MemoryLeases(),
+                storage.SQLiteLeases(sqlite_store, "leases") ]:
+    name = type(leases).__name__
+    token = leases.acquire("feed", 0.2)
+    assert token is not None, name
+    assert leases.acquire("feed", 0.2) is None, name
+    assert leases.acquire("other", 0.2) is not None, name
+    leases.release("feed", "not the token")
+    assert leases.acquire("feed", 0.2) is None, name
+    leases.release("feed", token)
+    token = leases.acquire("feed", 0.05)
+    assert token is not None, name
+    time.sleep(0.06)
+    assert leases.acquire("feed", 0.2) is not None, name
+    # Releasing an expired lease that someone else took leaves theirs
+    leases.release("feed", token)
+    assert leases.acquire("feed", 0.2) is None, name
+    assert 0.1 < leases.remaining("feed") <= 0.2, name
+    assert leases.remaining("nobody") == 0, name
+
+# Setting some fields leaves the rest, as they are now
+for name, table in [ ("memory", storage.MemoryTable()),
+                     ("sqlite", storage.SQLiteTable(sqlite_store, "fields")) ]:
+    table.put("a", { "id": "a", "path": [ 1 ], "latest": { "dateTime": "t1" } })
+    table.update_fields_many({ "a": { "latest.route_km.BC": 12.5,
+                                      "last_query_time": "t2" },
+                               "missing": { "latest.route_km.BC": 1.0 } })
+    assert table.get("a") == { "id": "a", "path": [ 1 ], "last_query_time": "t2",
+                               "latest": { "dateTime": "t1",
+                                           "route_km": { "BC": 12.5 } } }, name
+    assert table.get("missing") is None, name
@@ -0,0 +1,104 @@
+"""
+Reloading the TrackLeaders feed should write only the tracks with
+new messages (or changed paths, or new distances along routes), and
+say how many.
+"""
+
+import io
+import os
+import arrow
+
+# No MongoDB connection or TrackLeaders feed at import
+os.environ["storage_backend"] = "memory"
+os.environ["trackleaders_url"] = "http://localhost/fullfeed.xml"
+import trackleaders
+
+now = arrow.utcnow().timestamp
+def message(esn, id, minutes_ago, lat):
+    sent = now - 60 * minutes_ago
+    return ("<message><id>{}</id><esn>{}</esn><esnName>x</esnName>"
+            "<messageType>TRACK</messageType><messageDetail/>"
+            "<timestamp>{}</timestamp><timeInGMTSecond>{}</timeInGMTSecond>"
+            "<latitude>{}</latitude><longitude>-123.28</longitude>"
+            "<batteryState>GOOD</batteryState></message>"
+            .format(id, esn, arrow.get(sent).format("YYYY-MM-DDTHH:mm:ss.000")
+                    + "Z", sent, lat))
+
+def feed(racers):
+    return ("<trackleaders_aggregate_feed>" +
+            "".join("<trackleaders_feed>" + "".join(messages)
+                    + "</trackleaders_feed>" for messages in racers)
+            + "</trackleaders_aggregate_feed>")
+
+class FakeResponse(object):
+    """Stands in for the streaming response of pull_stream"""
+    def __init__(self, text):
+        self.raw = io.BytesIO(text.encode("utf-8"))
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        return False
+
+pull_stream = trackleaders.pull_stream
+def reload(text, routes=None):
+    trackleaders.pull_stream = lambda: FakeResponse(text)
+    return trackleaders.cache_reload(routes)
+
+racer_1 = [ message("0-1", "12", 10, 44.25), message("0-1", "11", 20, 44.24) ]
+racer_2 = [ message("0-2", "21", 15, 44.3) ]
+assert reload(feed([racer_1, racer_2])) == 2
+first_1 = trackleaders.tracks.get("0-1")
+assert first_1["newest_message_id"] == "12"
+
+# Nothing new: nothing written
+assert reload(feed([racer_1, racer_2])) == 0
+assert trackleaders.tracks.get("0-1") == first_1
+
+# A new message from one racer
+racer_1.insert(0, message("0-1", "13", 1, 44.26))
+assert reload(feed([racer_1, racer_2])) == 1
+assert trackleaders.tracks.get("0-1")["latest"]["latlon"] == [44.26, -123.28]
+assert trackleaders.tracks.get("0-1")["path"][0] == [44.26, -123.28]
+
+# Points older than the path window change nothing
+racer_2.append(message("0-2", "19", 75, 44.28))
+assert reload(feed([racer_1, racer_2])) == 0
+
+# A point leaving the path (as it ages out) changes the track
+racer_2.insert(1, message("0-2", "20", 30, 44.29))
+assert reload(feed([racer_1, racer_2])) == 1
+del racer_2[1]
+assert reload(feed([racer_1, racer_2])) == 1
+assert trackleaders.tracks.get("0-2")["path"] == [ [44.3, -123.28] ]
+
+# Measured along a route for the first time, the track is written
+assert "route_km" not in trackleaders.tracks.get("0-1")["latest"]
+assert reload(feed([racer_1, racer_2]), { "0-1": "Alsea" }) == 1
+assert "Alsea" in trackleaders.tracks.get("0-1")["latest"]["route_km"]
+assert reload(feed([racer_1, racer_2]), { "0-1": "Alsea" }) == 0
+
+# The poll record is not among the tracks
+trackleaders.polls.put("poll_record",
+                       { "trackleaders_poll": "poll_record",
+                         "last_query_time": arrow.now().isoformat() })
+assert sorted(key for key, _ in trackleaders.tracks.items()) == [ "0-1", "0-2" ]
+
+# A failed request for the feed is closed, and its error raised
+import requests
+class FailedResponse(object):
+    closed = False
+    status_code = 503
+    def raise_for_status(self):
+        raise requests.HTTPError("503 Server Error")
+    def close(self):
+        self.closed = True
+failed = FailedResponse()
+get = trackleaders.upstream.get
+trackleaders.upstream.get = lambda url, stream=False: failed
+try:
+    pull_stream()
+    assert False, "No error from a failed request"
+except requests.HTTPError:
+    assert failed.closed
+finally:
+    trackleaders.upstream.get = get
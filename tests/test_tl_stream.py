@@ -0,0 +1,76 @@
+"""
+Streaming the TrackLeaders feed should keep just the messages of the
+esns we track, dropping those too old for the path (but not an esn's
+latest), and reformat to the same tracks as parsing it whole.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+import os
+import arrow
+
+# No MongoDB connection or TrackLeaders feed at import
+os.environ["storage_backend"] = "memory"
+os.environ["trackleaders_url"] = "http://localhost/fullfeed.xml"
+import trackleaders
+
+now = arrow.utcnow().timestamp
+def message(esn, minutes_ago, lat=44.2):
+    sent = now - 60 * minutes_ago
+    return ("<message><id>{0}{1}</id><esn>{0}</esn><esnName>x</esnName>"
+            "<messageType>TRACK</messageType><messageDetail/>"
+            "<timestamp>{2}</timestamp><timeInGMTSecond>{3}</timeInGMTSecond>"
+            "<latitude>{4}</latitude><longitude>-123.28</longitude>"
+            "<batteryState>GOOD</batteryState></message>"
+            .format(esn, minutes_ago,
+                    arrow.get(sent).format("YYYY-MM-DDTHH:mm:ss.000") + "Z",
+                    sent, lat))
+
+feed = ("<trackleaders_aggregate_feed>"
+        "<trackleaders_feed><trackleaders_racer_ID>1</trackleaders_racer_ID>"
+        + message("0-1", 5, 44.25) + message("0-1", 20, 44.24)
+        + message("0-1", 90, 44.23) + "</trackleaders_feed>"
+        "<trackleaders_feed><trackleaders_racer_ID>2</trackleaders_racer_ID>"
+        + message("0-2", 1, -9999.0) + message("0-2", 180, 44.3)
+        + message("0-2", 200, 44.31) + "</trackleaders_feed>"
+        "<trackleaders_feed><trackleaders_racer_ID>3</trackleaders_racer_ID>"
+        + message("0-3", 2) + "</trackleaders_feed>"
+        "<trackleaders_feed><trackleaders_racer_ID>4</trackleaders_racer_ID>"
+        + message("0-4", 200, 44.4) + message("0-4", 150, 44.41)
+        + message("0-4", 170, 44.42) + "</trackleaders_feed>"
+        "</trackleaders_aggregate_feed>")
+
+def stream(esns=None, cutoff=None):
+    return list(trackleaders.iter_messages(io.BytesIO(feed.encode("utf-8")),
+                                           esns, cutoff))
+
+# Without filters, every message (less the bogus position)
+whole = [ { child.tag: child.text for child in msg }
+          for msg in ET.fromstring(feed).iter("message") ]
+assert stream() == [ msg for msg in whole if float(msg["latitude"]) > -90 ]
+
+cutoff = now - 3600
+kept = [ (msg["esn"], msg["latitude"]) for msg in stream({"0-1", "0-2"}, cutoff) ]
+assert kept == [ ("0-1", "44.25"), ("0-1", "44.24"), ("0-2", "44.3") ], kept
+
+# Same tracks from the stream as from the whole feed
+tracks = trackleaders.reformat(stream({"0-1", "0-2"}, cutoff))
+expected = [ track for track in trackleaders.reformat(whole)
+             if track["id"] in {"0-1", "0-2"} ]
+for track in tracks + expected:
+    del track["last_query_time"]
+assert tracks == expected, (tracks, expected)
+assert tracks[0]["path"] == [ [44.25, -123.28], [44.24, -123.28] ]
+assert tracks[1]["latest"]["latlon"] == [44.3, -123.28]
+
+# Messages in any order make the same tracks, dated by timeInGMTSecond
+shuffled = trackleaders.reformat(list(reversed(whole)))
+for track in shuffled:
+    del track["last_query_time"]
+shuffled = { track["id"]: track for track in shuffled }
+assert [ shuffled["0-1"], shuffled["0-2"] ] == tracks
+assert tracks[0]["latest"]["dateTime"] == arrow.get(now - 300).isoformat()
+
+# Out of order, an esn with only old messages keeps its newest
+kept = [ (msg["esn"], msg["latitude"]) for msg in stream({"0-4"}, cutoff) ]
+assert kept == [ ("0-4", "44.41") ], kept
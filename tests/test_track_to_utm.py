@@ -0,0 +1,43 @@
+"""
+Route preparation in bulk (track_to_utm with numpy) should agree 
+with measuring point by point:  the same projected coordinates, and 
+cumulative distances within 1e-6 km before rounding. 
+"""
+
+import measure
+import json
+import math
+
+TOLERANCE_KM = 0.000001
+
+if measure.np is None:
+    print("numpy is not installed; nothing to compare")
+else:
+    with open("static/routes/Alsea_points.json") as f:
+        track = json.load(f)
+    mid_lat, mid_lon = measure.track_centerpoint(track)
+    _, _, zone, _ = measure.utm.from_latlon(mid_lat, mid_lon)
+    eastings, northings, cum_km = measure.utm_columns(track, zone)
+
+    tot_km = 0.0
+    prev = track[0]
+    for i, pt in enumerate(track):
+        easting, northing, _, _ = measure.utm.from_latlon(
+            pt[0], pt[1], force_zone_number=zone)
+        tot_km += measure.dist_km(prev, pt)
+        prev = pt
+        assert abs(easting - eastings[i]) < 0.001
+        assert abs(northing - northings[i]) < 0.001
+        assert abs(tot_km - cum_km[i]) < TOLERANCE_KM, \
+          "Point {}: {} vs {}".format(i, tot_km, cum_km[i])
+
+    # Coincident points and a long east-west segment
+    lats = [44.0, 0.0, 44.0]
+    lons = [-123.0, 10.0, -123.0]
+    bulk = measure.dist_km_array(lats, lons, [44.0, 0.0, 44.0],
+                                 [-123.0, 11.0, -120.0])
+    assert bulk[0] == 0.0
+    assert abs(bulk[1] - measure.dist_km((0.0, 10.0), (0.0, 11.0))) \
+      < TOLERANCE_KM
+    assert abs(bulk[2] - measure.dist_km((44.0, -123.0), (44.0, -120.0))) \
+      < TOLERANCE_KM
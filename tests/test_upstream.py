@@ -0,0 +1,51 @@
+"""
+The upstream client should reuse its connection to a host, give up
+on a host that does not answer within the timeout, and count and 
+time requests per host. 
+"""
+
+import upstream
+import requests
+import threading
+import time
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+connections = set()
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # Keep-alive
+
+    def do_GET(self):
+        connections.add(self.client_address)
+        if self.path.startswith("/slow"):
+            time.sleep(1.0)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+server = HTTPServer(("127.0.0.1", 0), Handler)
+server.handle_error = lambda request, address: None  # Client gave up
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = "http://127.0.0.1:{}/".format(server.server_port)
+try:
+    for _ in range(3):
+        assert upstream.get(url, params={ "start": 0 }).json() == { "ok": True }
+    assert len(connections) == 1, "One kept-alive connection"
+
+    try:
+        upstream.get(url + "slow", timeout=(1, 0.2))
+        assert False, "Should time out"
+    except requests.RequestException:
+        pass
+
+    stats = upstream.stats()["127.0.0.1"]
+    assert stats["requests"] == 4 and stats["errors"] == 1, stats
+    assert stats["max_ms"] >= 200
+finally:
+    server.shutdown()
@@ -0,0 +1,48 @@
+"""
+The NumPy kernel behind interpolate_route_distance should agree 
+with the one-segment-at-a-time loop it replaces, on and off route,
+with and without a direction of travel, on the Alsea Loop and on 
+the (much longer) Cascade 1200 route. 
+"""
+
+import measure
+import json
+
+TOLERANCE_KM = 0.000001
+
+def loop_dist(lat, lon, prior, utm_track, zone):
+    """The pure-Python computation, as when numpy is missing"""
+    saved = measure.np
+    measure.np = None
+    try:
+        return measure.interpolate_route_distance(lat, lon, utm_track, zone,
+                                                  prior_obs=prior)
+    finally:
+        measure.np = saved
+
+def check_route(prefix):
+    with open("static/routes/{}_dists.json".format(prefix)) as track, \
+         open("static/routes/{}_points.json".format(prefix)) as points:
+        track_obj = json.load(track)
+        route_points = json.load(points)
+    zone = track_obj["zone"]
+    arrays = measure.RouteArrays.from_path(track_obj["path"])
+    prior = None
+    for lat, lon in route_points[::7]:
+        for nudged in [(lat, lon), (lat + 0.002, lon - 0.003),
+                           (lat + 0.03, lon + 0.03)]:
+            for from_point in [None, prior]:
+                expected = loop_dist(nudged[0], nudged[1], from_point,
+                                     track_obj["path"], zone)
+                measured = measure.interpolate_route_distance(
+                    nudged[0], nudged[1], arrays, zone, prior_obs=from_point)
+                assert abs(expected - measured) < TOLERANCE_KM, \
+                  "{} at {} from {}: loop {}, vectorized {}".format(
+                      prefix, nudged, from_point, expected, measured)
+        prior = (lat, lon)
+
+if measure.np is None:
+    print("numpy is not installed; nothing to compare")
+else:
+    check_route("Alsea")
+    check_route("Cascade")
@@ -4,24 +4,39 @@ pretty much like we get from spot.py.
 
 This is an aggregated feed, so we don't need delays ... we just read a 
 whole feed, which looks like the sample at the end of this file. 
+It can be large (every racer of an ultra-race, days of messages), so
+we parse it as it streams in (iter_messages), keeping only messages
+of the esns we track that are recent enough to matter. 
 
 
 
 """
 
 
+import array
+import datetime
+import itertools
 import requests
 import xml.etree.ElementTree as ET
 import arrow
 
-from typing import List, Dict
+from typing import List, Dict, Set, Iterable, Iterator, Tuple
 
 # Configured variables
 import config
-from pymongo import MongoClient
-from pymongo import ReplaceOne
-MONGO_URL = config.get("mongo_url")
+import progress
+import upstream
+import storage
+import coalesce
 URL = config.get("trackleaders_url")
+REFRESH_LEASE_SECONDS = float(config.get("refresh_lease_seconds"))
+# Comma-separated esns to keep from the feed; empty keeps all
+TRACKLEADERS_ESNS = set(esn.strip() for esn
+                        in config.get("trackleaders_esns").split(",")
+                        if esn.strip())
+
+# Recent points, for the path we draw
+PATH_HOURS = 1
 
 
 
@@ -31,51 +46,67 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
 # Performed once at instantiation
-# Database collection
-client = MongoClient(MONGO_URL)
-db = client.enroute
-collection = db.tl_tracks   # TrackLeaders tracks
-
-# Cached access --- we read from MongoDB database,
+# Database tables (see storage.py)
+tracks = storage.table("tl_tracks", "id")   # TrackLeaders tracks
+# The record of our last poll, in its own table so that it is not
+# taken for a track
+polls = storage.table("tl_polls", "trackleaders_poll")
+# One reload at a time: in this process, and (by lease) in every
+# worker sharing the database
+in_flight = coalesce.SingleFlight()
+reload_leases = storage.leases("leases")
+
+# Cached access --- we read from the database,
 # optionally refilling the database if the last access
 # was more than 1 minute ago.
 #
 
 
-def get_tracks(feed_list: List[str]) -> List[dict]:
+def get_tracks(feed_list: List[str],
+               routes: Dict[str, str] = None) -> List[dict]:
     """feed_list is a list of esns.  We return
     a list of dicts representing tracks.  The list includes
     only the requested tracks, which are accessed from the
     database cache.  Cache reload may be triggered if
     last query is older than the polling interval.
+    routes, if given, maps esns to route abbreviations, as
+    for spot.get_feeds.
     """
-    cache_reload_if_stale()
-    return tracks_from_cache(feed_list)
+    cache_reload_if_stale(routes)
+    return tracks_from_cache(feed_list, routes)
 
-def tracks_from_cache(feed_list: List[str]) -> List[dict]:
+def tracks_from_cache(feed_list: List[str],
+                      routes: Dict[str, str] = None) -> List[dict]:
     """Get just the requested tracks from cache.
     (Thus tracks that TrackLeaders is still reporting, but which
     have been marked inactive in configuration, will not be reported
-    back to the map.)
+    back to the map.)  A latest observation not yet measured along
+    its rider's route in routes is measured now.
     """
+    if routes is None:
+        routes = { }
     log.debug(f"Tracks from cache Looking for {feed_list}")
-    feeds_requested = set(feed_list)
     feeds = [ ]
-    for feed in collection.find():
-        if  "id" in feed and feed["id"] in feeds_requested:
-            #for feed in feed_list:
-            #track = collection.find_one({"id": feed})
-            #if track is not None:
-                if "_id" in feed:
-                    del feed["_id"]   # Because it isn't json serializable
-                feeds.append(feed)
+    measured = { }
+    for feed in tracks.get_many(set(feed_list)).values():
+        route = routes.get(feed["id"])
+        latest = feed.get("latest")
+        if (route and latest and
+                route not in latest.get("route_km", { })):
+            km = progress.add_progress(latest, route)
+            if km is not None:
+                # Just the distance, not over a reload since we read
+                measured[feed["id"]] = { f"latest.route_km.{route}": km }
+        feeds.append(feed)
+    if measured:
+        tracks.update_fields_many(measured)
     log.debug("Done with tracks from cache")
     return feeds
 
 
 
-def cache_reload_if_stale():
-    """Reload track records into Mongo collection
+def cache_reload_if_stale(routes: Dict[str, str] = None):
+    """Reload track records into the database
     if the cache in database is older than
     the polling interval (currently 1 minute).
     Since TrackLeaders is an aggregated feed,
@@ -88,89 +119,206 @@ def cache_reload_if_stale():
     # last read time, keeping it in database is safer in case
     # there are multiple instances of this program.
     log.debug("Testing staleness")
-    now = arrow.now()
-    stale = now.replace(minutes=-1)
-    request = { "trackleaders_poll": "poll_record" }
-    record = collection.find_one(request)
-    if record is None:
-        log.debug("No prior poll record")
-        collection.insert( {"trackleaders_poll": "poll_record",
-              "last_query_time": now.isoformat()
-             })
-        cache_reload()
-    elif arrow.get(record["last_query_time"]) < stale:
-        log.debug("Trackleaders cache is stale")
-        collection.update_one( {"trackleaders_poll": "poll_record"},
-             { "$set": {"last_query_time": now.isoformat() }})
-        cache_reload()
+    if poll_is_stale():
+        # Threads arriving during a reload wait for it
+        in_flight.do("poll_record", _reload_leased, routes)
     else:
         log.debug("Would be using existing cache")
-        #FIXME:  nothing to do here?
     log.debug("Done with test/reload")
 
-def cache_reload():
-    """Cache is stale; reload it here."""
+def poll_is_stale() -> bool:
+    """Is there no poll record, or one older than a minute?"""
+    record = polls.get("poll_record")
+    if record is None:
+        log.debug("No prior poll record")
+        return True
+    return arrow.get(record["last_query_time"]) < arrow.now().replace(minutes=-1)
+
+def _reload_leased(routes: Dict[str, str] = None):
+    """cache_reload, unless another worker is reloading or has just
+    reloaded; then other workers use the existing cache.
+    """
+    token = reload_leases.acquire("trackleaders", REFRESH_LEASE_SECONDS)
+    if token is None:
+        log.debug("Another worker is reloading")
+        return
+    try:
+        if not poll_is_stale():
+            log.debug("Another worker has reloaded")
+            return
+        log.debug("Trackleaders cache is stale")
+        polls.put("poll_record", {"trackleaders_poll": "poll_record",
+              "last_query_time": arrow.now().isoformat()
+             })
+        cache_reload(routes)
+    finally:
+        reload_leases.release("trackleaders", token)
+
+def cache_reload(routes: Dict[str, str] = None) -> int:
+    """Cache is stale; reload it here.  Only tracks that changed
+    (a new message, points aged out of the path, or a distance
+    along a route newly measured) are written;
+    the others keep their records, including last_query_time of
+    the reload that last changed them.  Returns how many tracks
+    were written.
+    """
     log.debug("Reloading cache")
-    text = pull()
-    messages = extract(text)
-    tracks = reformat(messages)
-    log.debug("Updating Mongo")
-    requests = [ ]
-    for track in tracks:
-        requests.append(ReplaceOne({"id": track["id"]}, track, upsert=True))
-    result = collection.bulk_write(requests)
-    log.debug(f"Done  updating Mongo, replaced {result.modified_count}")
+    previous = { }
+    if routes:
+        for feed, track in tracks.get_many(routes).items():
+            previous[feed] = track.get("latest")
+    cutoff = arrow.now().replace(hours=-PATH_HOURS).timestamp
+    with pull_stream() as response:
+        # Messages are reformatted as they are parsed
+        messages = iter_messages(response.raw, TRACKLEADERS_ESNS, cutoff)
+        reloaded = reformat(messages, routes, previous)
+    log.debug("Updating database")
+    stored = tracks.get_many(track["id"] for track in reloaded)
+    changed = { track["id"]: track for track in reloaded
+                if track_changed(track, stored.get(track["id"])) }
+    if changed:
+        tracks.put_many(changed)
+    log.info(f"TrackLeaders reload changed {len(changed)} "
+             f"of {len(reloaded)} tracks")
     log.debug("Done reloading cache")
+    return len(changed)
+
+def track_changed(track: dict, stored: dict = None) -> bool:
+    """Does reloaded track differ from the stored record of it?
+    Its latest observation is that of its newest message, so we
+    need not compare that, except for its distances along routes.
+    """
+    return (stored is None
+            or stored.get("newest_message_id") != track["newest_message_id"]
+            or stored.get("path") != track["path"]
+            or (stored.get("latest", { }).get("route_km")
+                != track["latest"].get("route_km")))
 
 
-def pull() -> str:
-    log.debug("pull")
+def pull_stream() -> requests.Response:
+    """The feed as a streaming response (use in a with statement);
+    its raw attribute is a file of the (decompressed) XML.
+    """
+    log.debug("pull_stream")
+    r = upstream.get(URL, stream=True)
+    log.debug(f"Status code: {r.status_code}")
     try:
-        r = requests.get(URL)
-        log.debug(f"Status code: {r.status_code}")
-        text = r.text
-        log.debug("Done with pull")
-        return text
-    except requests.RequestException as e:
-        print(f"Exception {e}")
-        raise e
-
-def extract(txt: str) -> List[dict]:
+        r.raise_for_status()
+    except requests.HTTPError:
+        r.close()
+        raise
+    r.raw.decode_content = True
+    return r
+
+def iter_messages(source, esns: Set[str] = None,
+                  cutoff: int = None) -> Iterator[dict]:
+    """Messages of the feed read from file source, each a dict of the
+    children of a "message" element (tags and text as they appear in
+    the feed), parsed incrementally and each generated as soon as it
+    is read, so that we never hold the whole document.  If esns is
+    given (and not empty), only messages of those esns are kept.
+    If cutoff (a unix time) is given, only messages no older than
+    cutoff are kept, and for an esn with none of those, its newest
+    message (by timeInGMTSecond, in whatever order the feed has
+    them), generated at the end.  Messages with bogus positions (see
+    reformat) are dropped.
     """
-    Returns extracted list of dicts, each dict representing
-    a "message" element with its children being key:value pairs
-    in the dict.  Keys and values are as they appear in the
-    TrackLeaders feed, without any selection or further processing.
-
-    The "design secret" of this function is the XML element
-    hierarchy of the TrackLeaders feed.
+    recent = set()      # esns with a message no older than cutoff
+    newest_old = { }    # esn -> its newest message older than cutoff
+    root = None
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        if element.tag == "message":
+            message = { child.tag: child.text for child in element }
+            element.clear()
+            esn = message.get("esn")
+            if esns and esn not in esns:
+                continue
+            if float(message["latitude"]) < -90:
+                continue
+            sent = message.get("timeInGMTSecond")
+            if cutoff is not None and sent is not None and int(sent) < cutoff:
+                if esn not in recent:
+                    held = newest_old.get(esn)
+                    if (held is None
+                            or int(sent) > int(held["timeInGMTSecond"])):
+                        newest_old[esn] = message
+                continue
+            recent.add(esn)
+            newest_old.pop(esn, None)
+            yield message
+        elif element.tag == "trackleaders_feed":
+            # Done with this racer; let go of the elements parsed
+            root.clear()
+    for message in newest_old.values():
+        yield message
+
+class MessageTable(object):
+    """Messages of the feed (as from iter_messages) by
+    column, each column an array (or list) indexed by row: esn (an
+    index into esns, which are in order of first appearance),
+    message_id, time (unix seconds), latitude, longitude, battery.
+    Each field is converted once, here; TrackLeaders tags powered
+    off spots with bogus lat and lon values of -9999.0, which break
+    things, so we skip those.
     """
-    log.debug("Extract")
-    root = ET.fromstring(txt)
-    #log.debug(f"Type of root is {type(root)}, should be trackleaders_aggregate_feed")
-    #log.debug(f"Tag of root is {root.tag}, type {type(root.tag)}")
-    messages = [ ]
-    for feed in root:
-        #log.debug(f"   Child of root, tag is {feed.tag}; should be trackleaders_feed")
-        for message in feed:
-            #log.debug(f"      Tag is {message.tag}, we are looking for 'message'")
-            if message.tag != 'message':
-                #log.debug(f"Skipping {message.tag}")
+
+    def __init__(self, messages: Iterable[dict]):
+        self.esns = [ ]
+        self.esn = array.array("l")
+        self.message_id = [ ]
+        self.time = array.array("q")
+        self.latitude = array.array("d")
+        self.longitude = array.array("d")
+        self.battery = [ ]
+        esn_index = { }
+        for msg in messages:
+            latitude = float(msg["latitude"])
+            if latitude < -90:
                 continue
-            message_dict = { }
-            for element in message:
-                key = element.tag
-                value = element.text
-                #log.debug(f"Saving pair ({key}, {value})")
-                message_dict[key] = value
-            messages.append(message_dict)
-    log.debug("Done  with extract")
-    return messages
-
-def reformat(messages: List[dict]) -> List[dict]:
+            esn = msg["esn"]
+            index = esn_index.get(esn)
+            if index is None:
+                index = esn_index[esn] = len(self.esns)
+                self.esns.append(esn)
+            sent = msg.get("timeInGMTSecond")
+            if sent is None:
+                sent = arrow.get(msg["timestamp"]).timestamp
+            self.esn.append(index)
+            self.message_id.append(msg["id"])
+            self.time.append(int(sent))
+            self.latitude.append(latitude)
+            self.longitude.append(float(msg["longitude"]))
+            self.battery.append(msg["batteryState"])
+
+    def __len__(self):
+        return len(self.esn)
+
+    def by_esn(self) -> Iterator[Tuple[str, List[int]]]:
+        """(esn, rows) for each esn in order of first appearance,
+        rows newest first (in feed order among equal times)
+        """
+        esn, time = self.esn, self.time
+        order = sorted(range(len(esn)), key=lambda row: (esn[row], -time[row]))
+        for index, rows in itertools.groupby(order, key=esn.__getitem__):
+            yield self.esns[index], list(rows)
+
+def _iso_time(unix_time: int) -> str:
+    """ISO 8601 (UTC) for unix_time, as arrow formats it"""
+    return datetime.datetime.fromtimestamp(
+        unix_time, datetime.timezone.utc).isoformat()
+
+def reformat(messages: Iterable[dict], routes: Dict[str, str] = None,
+             previous: Dict[str, dict] = None) -> List[dict]:
     """Takes list of messages in TrackLeaders format and
     delivers list of tracks in format as similar as possible
-    to what we produce for a spot feed.
+    to what we produce for a spot feed.  If routes maps an esn
+    to a route abbreviation, its latest observation is measured
+    along the route (see progress.py); previous maps esns to the
+    latest observations they replace.
     Input looks like:
     [{'id': '993354437',
     'esn': '0-2578655',
@@ -190,61 +338,52 @@ def reformat(messages: List[dict]) -> List[dict]:
 
     { "id": "0-2578655",  # This will be from esn, not from the id field
       "last_query_time": '2018-06-19T19:39:37.712494-07:00', # Time of query, not of spot message
+      "newest_message_id": '993354437',  # id of the message in latest
       "latest": { "dateTime": '2018-06-19T19:39:37.712494-07:00',
                   "latlon":   [ 40.11396, 95.7913],
                   "batteryState":  "LOW" },
       "path": [[40.11396, 95.7913], [40.11400, 95.7928], ... ]
     }
-    latlon pairs in path are those from messages fresher than expiration time.
-    latest is from the most recent observation of a tracker.
+    latlon pairs in path are those from messages fresher than expiration time,
+    newest first.  latest is from the most recent observation of a tracker
+    (by timeInGMTSecond, so in any order of messages).  It has
+    prior_position if there is a second fresh point, and route_km if
+    measured along a route.
     """
     log.debug("Reformatting messages")
     now = arrow.now().isoformat()
-    #FIXME: real messages will expire in an hour, not a month
-    expires = arrow.now().replace(hours=-1)
-    # Pass 1: We build up a dict keyed by esn.  Each
-    # value in dict will become an element of the output list.
-    table = {}
-    for msg in messages:
-        esn = msg["esn"]
-        # TrackLeaders tags powered off spots with bogus lat and lon values of -9999.0.
-        # Those break things.  Skip them.
-        if float(msg["latitude"]) < -90:
-            continue
-        if esn not in table:
-            initial = {
-                "id": esn,
-                "last_query_time": now,
-                "latest": {
-                    "dateTime": arrow.get(msg["timestamp"]).isoformat(),
-                    "latlon": [float(msg["latitude"]), float(msg["longitude"])],
-                    "batteryState": msg["batteryState"]
-                },
-                "path": [ ]
-            }
-        table[esn] = initial
-        # Now we know it is in the table, so the question is whether to replace
-        # the latest observation. Points seem to occur in backwards time order,
-        # although this is not documented.  (Nothing is documented.)
-        # I'm going to hope I can count on that,
-        # so I don't need to sort points.  If I *do* need to sort points, it may be
-        # simpler to just sort the collection of messages by time-stamp; that way no
-        # need to tag each path component with a time.
-        # First: Too old?
-        observed_at = arrow.get(msg["timestamp"])
-        if observed_at < expires:
-            #log.debug(f"Message expired at {observed_at} (earlier than {expires}")
-            continue
-        # Within observation window.
-        track = table[esn]
-        if observed_at > arrow.get(track["latest"]["dateTime"]):
-            log.warn("Newer observation replacing latest!")
-            # FIXME  If I ever see this warning, I need to handle out-of-order messages
-        point = [float(msg["latitude"]), float(msg["longitude"])]
-        track["path"].append(point)
-    # After all messages, we need to convert from dict to list
+    expires = arrow.now().replace(hours=-PATH_HOURS).timestamp
+    table = MessageTable(messages)
+    routes = routes or { }
+    previous = previous or { }
+    tracks = [ ]
+    for esn, rows in table.by_esn():
+        newest = rows[0]
+        # Messages are newest first, so the fresh ones lead
+        path = [ [table.latitude[row], table.longitude[row]]
+                 for row in itertools.takewhile(
+                         lambda row: table.time[row] >= expires, rows) ]
+        track = {
+            "id": esn,
+            "last_query_time": now,
+            "newest_message_id": table.message_id[newest],
+            "latest": {
+                "dateTime": _iso_time(table.time[newest]),
+                "latlon": [table.latitude[newest], table.longitude[newest]],
+                "batteryState": table.battery[newest]
+            },
+            "path": path
+        }
+        # The previous point gives direction of travel, and we can
+        # measure progress of riders on known routes
+        if len(path) > 1:
+            track["latest"]["prior_position"] = path[1]
+        if esn in routes:
+            progress.add_progress(track["latest"], routes[esn],
+                                  previous.get(esn))
+        tracks.append(track)
     log.debug("Done reformatting")
-    return list(table.values())
+    return tracks
 
 
 if __name__ == "__main__":
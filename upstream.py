@@ -0,0 +1,128 @@
+"""
+HTTP client for the upstream feeds (Spot, TrackLeaders).
+
+All requests go through one shared requests.Session, so connections
+to each host are pooled and kept alive between polls instead of
+paying a new TLS handshake every time, and responses are accepted
+compressed.  Each host gets its own timeouts (UPSTREAM_TIMEOUTS, or
+the configured default), so a hung upstream cannot stall a worker,
+and failed connections and 5xx/429 responses are retried a bounded
+number of times with backoff.  We keep per-host counts and
+latencies for stats().
+"""
+
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+
+import logging
+logging.basicConfig(format='%(levelname)s:%(message)s',
+                        level=logging.INFO)
+log = logging.getLogger(__name__)
+
+# Configurable ...
+UPSTREAM_TIMEOUT_SECONDS = float(config.get("upstream_timeout_seconds"))
+UPSTREAM_RETRIES = int(config.get("upstream_retries"))
+
+CONNECT_TIMEOUT_SECONDS = 5
+# (connect, read) timeouts for hosts that need other than the default
+UPSTREAM_TIMEOUTS = {
+    "trackleaders.com": (CONNECT_TIMEOUT_SECONDS, 60),  # Big aggregate feed
+}
+POOL_SIZE = 16            # Connections kept per host; >= spot_fetch_workers
+LATENCY_SAMPLES = 200     # Recent latencies kept per host, for percentiles
+
+
+class HostStats(object):
+    """Counts and recent latencies of requests to one host"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.recent = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, seconds, error=False):
+        self.requests += 1
+        if error:
+            self.errors += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def summary(self):
+        ordered = sorted(self.recent)
+        def percentile(p):
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+        return { "requests": self.requests,
+                 "errors": self.errors,
+                 "mean_ms": round(1000 * self.total_seconds
+                                  / max(self.requests, 1), 1),
+                 "p50_ms": round(1000 * percentile(50), 1),
+                 "p90_ms": round(1000 * percentile(90), 1),
+                 "max_ms": round(1000 * self.max_seconds, 1) }
+
+
+def _session():
+    # A read that timed out is not retried: a host that hung once
+    # is likely to hang again, and we would wait out each timeout
+    retry = Retry(total=UPSTREAM_RETRIES, read=0, backoff_factor=0.5,
+                  status_forcelist=[429, 500, 502, 503, 504],
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+                          max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+def timeout_for(host):
+    """(connect, read) timeout in seconds for host"""
+    for suffix, timeout in UPSTREAM_TIMEOUTS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return timeout
+    return (CONNECT_TIMEOUT_SECONDS, UPSTREAM_TIMEOUT_SECONDS)
+
+
+# Performed once at instantiation; shared by all threads
+# in this process
+session = _session()
+_stats = { }
+_stats_lock = threading.Lock()
+
+def get(url, params=None, **kwargs):
+    """GET url (with query params) through the shared session, with
+    the host's timeout unless one is given.  Returns the
+    requests.Response; raises requests.RequestException on failure
+    after retries.
+    """
+    host = urlsplit(url).hostname or ""
+    kwargs.setdefault("timeout", timeout_for(host))
+    started = time.perf_counter()
+    error = True
+    try:
+        response = session.get(url, params=params, **kwargs)
+        error = response.status_code >= 400
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        with _stats_lock:
+            _stats.setdefault(host, HostStats()).record(elapsed, error)
+        log.debug("GET {} took {:.3f}s".format(host, elapsed))
+
+def stats():
+    """Per-host request counts and latencies"""
+    with _stats_lock:
+        return { host: host_stats.summary()
+                 for host, host_stats in _stats.items() }